@@ -2,6 +2,8 @@
 Pytest configuration file.
 """
 import os
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -13,3 +15,40 @@ def set_test_api_key():
         os.environ["INIA_API_KEY"] = "test-api-key-for-ci"
     yield
     # Cleanup is optional since it's session scoped
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_numba_kernels():
+    """
+    Compile the optional numba kernels once, before any test runs.
+    
+    Keeps JIT time out of individual test timings; with ``cache=True`` the
+    compiled code is reused by later sessions and pytest-xdist workers.
+    No-op when numba is not installed.
+    """
+    from iniamet import qc, utils
+    
+    if qc._HAS_NUMBA:
+        values = np.zeros(8)
+        qc._sudden_kernel(values, np.arange(8.0), 1.0, 2.0)
+        qc._hampel_kernel(values, 2, 3.0)
+    utils.normalize_texts(['Ñuble'] * utils.NUMBA_NORMALIZE_MIN_SIZE)
+
+
+# Shared read-only test data (session-scoped: tests must not mutate it)
+@pytest.fixture(scope="session")
+def sample_records():
+    """Two hourly temperature records as returned by APIClient.get_data."""
+    return [
+        {'tiempo': '2024-09-01 00:00:00', 'valor': 15.5},
+        {'tiempo': '2024-09-01 01:00:00', 'valor': 16.0}
+    ]
+
+
+@pytest.fixture(scope="session")
+def hourly_temperature_df():
+    """One day of plausible hourly temperatures (passes every QC check)."""
+    return pd.DataFrame({
+        'tiempo': pd.date_range('2024-01-01', periods=24, freq='h'),
+        'valor': [15.0 + i * 0.5 for i in range(24)]
+    })
@@ -2,7 +2,7 @@ from setuptools import setup, find_packages
 
 setup(
     name="iniamet",
-    version="0.1.1",
+    version="0.3.0",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     python_requires=">=3.8",
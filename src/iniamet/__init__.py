@@ -23,7 +23,7 @@ Example usage:
     >>> mapa = quick_temp_map(client, region='Ñuble', date='2025-10-12')
 """
 
-__version__ = "0.2.0"
+__version__ = "0.3.0"
 __author__ = "INIA Climate Data Team"
 __license__ = "MIT"
 
@@ -35,11 +35,13 @@ from .qc import QualityControl, apply_quality_control, get_qc_report
 from .utils import (
     get_region_name, 
     get_variable_info, 
+    get_variable_infos,
     list_all_variables,
     get_variable_id_by_name,
     is_valid_variable_id,
     REGION_MAP, 
     VARIABLE_INFO,
+    VALID_VARIABLE_IDS,
     # Variable ID constants for easy access
     VAR_PRECIPITACION,
     VAR_TEMPERATURA_MEDIA,
@@ -54,7 +56,7 @@ from .utils import (
     VAR_BATERIA_VOLTAJE
 )
 
-# Import visualization only if IPython is available (optional dependency)
+# Import visualization only if folium is available (optional dependency)
 try:
     from .visualization import plot_temperature_map, plot_station_map, quick_temp_map
     _HAS_VISUALIZATION = True
@@ -77,11 +79,13 @@ __all__ = [
     "quick_temp_map",
     "get_region_name",
     "get_variable_info",
+    "get_variable_infos",
     "list_all_variables",
     "get_variable_id_by_name",
     "is_valid_variable_id",
     "REGION_MAP",
     "VARIABLE_INFO",
+    "VALID_VARIABLE_IDS",
     # Variable ID constants
     "VAR_PRECIPITACION",
     "VAR_TEMPERATURA_MEDIA",
@@ -7,22 +7,196 @@ error handling, and response parsing.
 Important: Users must configure their own API key. See README for instructions.
 """
 
+import asyncio
+import json
 import logging
+import threading
 import time
+from contextlib import contextmanager, nullcontext
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import os
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+    
+    Args:
+        value: Raw header value
+    
+    Returns:
+        Seconds to wait, or None if missing/unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace requests to the API host.
+    
+    The rate is halved whenever the server answers 429 (honoring any
+    Retry-After delay) and ramps up linearly on successful requests, past
+    the starting rate up to ``max_rate``, to find the server's actual limit.
+    
+    Example:
+        >>> bucket = TokenBucket(rate=2.0, max_rate=10.0)
+        >>> bucket.acquire()  # blocks until a token is available
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: float = 0.1,
+        ramp_step: float = 0.1,
+        max_rate: Optional[float] = None
+    ):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Starting requests per second
+            capacity: Maximum burst size (defaults to max(1, rate))
+            min_rate: Lower bound for the rate after penalties
+            ramp_step: Fraction of the starting rate gained per success
+            max_rate: Upper bound the rate may ramp up to (defaults to rate)
+        """
+        self.base_rate = float(rate)
+        self.max_rate = max(self.base_rate, float(max_rate or rate))
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self.min_rate = min_rate
+        self.ramp_step = ramp_step
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def _try_acquire(self) -> float:
+        """Consume a token if one is available; otherwise return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._blocked_until and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return max(
+                self._blocked_until - now,
+                (1.0 - self._tokens) / self.rate
+            )
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        wait = self._try_acquire()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._try_acquire()
+    
+    async def acquire_async(self):
+        """Like ``acquire`` but waits with ``asyncio.sleep`` so the event loop keeps running."""
+        wait = self._try_acquire()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._try_acquire()
+    
+    @property
+    def throttled(self) -> bool:
+        """True while recovering from a 429 (reduced rate or Retry-After pending)."""
+        return self.rate < self.base_rate or time.monotonic() < self._blocked_until
+    
+    def penalize(self, retry_after: Optional[float] = None):
+        """
+        Halve the rate after a 429 response.
+        
+        Args:
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    def reward(self):
+        """Linearly ramp the rate up towards max_rate after a success."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                now = time.monotonic()
+                self._refill(now)
+                self.rate = min(self.max_rate, self.rate + self.base_rate * self.ramp_step)
+    
+    def set_rate(self, rate: float, max_rate: Optional[float] = None):
+        """
+        Restart pacing at a new rate.
+        
+        Args:
+            rate: New starting requests per second
+            max_rate: New upper bound for ramping up (defaults to rate)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.base_rate = float(rate)
+            self.max_rate = max(self.base_rate, float(max_rate or rate))
+            self.rate = float(rate)
+            self.capacity = max(1.0, self.rate)
+            self._tokens = min(self._tokens, self.capacity)
+
+
+def paced_requests(api, rate: Optional[float] = None, max_rate: Optional[float] = None):
+    """
+    ``api.paced(...)`` for an APIClient; a no-op context for other clients.
+    
+    Lets the downloaders accept any object with the APIClient request
+    methods (e.g., test doubles) without requiring a rate limiter.
+    """
+    if isinstance(api, APIClient):
+        return api.paced(rate, max_rate)
+    return nullcontext()
+
+
 class APIClient:
     """Low-level API client for INIA Agromet API v2."""
     
     BASE_URL = "https://agromet.inia.cl/api/v2"
     
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
+    # Connections kept alive per host (threaded downloads share the session)
+    POOL_MAXSIZE = 16
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        rate_limit: float = 2.0,
+        max_rate_limit: float = 10.0
+    ):
         """
         Initialize API client.
         
@@ -32,6 +206,11 @@ class APIClient:
                      2. ~/.iniamet/config file
                      3. Will raise error if none found
             timeout: Request timeout in seconds
+            rate_limit: Starting requests per second for bulk/concurrent
+                        downloads (see ``paced``); single calls are not paced
+                        unless the server has answered 429
+            max_rate_limit: Rate the limiter may ramp up to while requests
+                            keep succeeding
             
         Raises:
             ValueError: If no API key is provided or found
@@ -51,9 +230,18 @@ class APIClient:
         # Try to get API key from multiple sources
         self.api_key = self._get_api_key(api_key)
         self.timeout = timeout
+        self.rate_limiter = TokenBucket(rate=rate_limit, max_rate=max_rate_limit)
+        self._paced_runs = 0
+        self._paced_lock = threading.Lock()
+        self._paced_defaults = (self.rate_limiter.base_rate, self.rate_limiter.max_rate)
+        self._paced_overrides = []
         self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=self.POOL_MAXSIZE, pool_maxsize=self.POOL_MAXSIZE)
+        )
         self.session.headers.update({
-            'User-Agent': 'Python/INIAMET-Library/0.1.0'
+            'User-Agent': 'Python/INIAMET-Library/0.3.0'
         })
     
     def _get_api_key(self, provided_key: Optional[str] = None) -> str:
@@ -115,6 +303,60 @@ class APIClient:
             + "="*70
         )
     
+    @contextmanager
+    def paced(self, rate: Optional[float] = None, max_rate: Optional[float] = None):
+        """
+        Pace every request through the rate limiter while the block runs.
+        
+        Used by bulk and concurrent downloads; outside such blocks requests
+        are only delayed after a 429 response.
+        
+        Blocks may overlap (e.g., from different threads). The configured
+        rate is saved when the first block enters and restored when the last
+        one exits; while several blocks override the rate, the most recently
+        entered one still running wins.
+        
+        Args:
+            rate: Optional starting rate for the block
+            max_rate: Optional ramp-up ceiling for the block (defaults to the
+                      larger of rate and the configured ceiling)
+        
+        Example:
+            >>> with api.paced(rate=8.0):
+            ...     ...  # threaded downloads
+        """
+        override = None
+        with self._paced_lock:
+            if self._paced_runs == 0:
+                limiter = self.rate_limiter
+                self._paced_defaults = (limiter.base_rate, limiter.max_rate)
+            self._paced_runs += 1
+            if rate:
+                # object() keeps entries with equal rates distinct
+                override = (object(), rate, max_rate)
+                self._paced_overrides.append(override)
+                self._apply_paced_rate()
+        try:
+            yield self
+        finally:
+            with self._paced_lock:
+                self._paced_runs -= 1
+                if override is not None:
+                    self._paced_overrides.remove(override)
+                    self._apply_paced_rate()
+    
+    def _apply_paced_rate(self):
+        """Apply the newest rate override, or the configured rate; caller holds ``_paced_lock``."""
+        if not self._paced_overrides:
+            self.rate_limiter.set_rate(*self._paced_defaults)
+            return
+        _, rate, max_rate = self._paced_overrides[-1]
+        self.rate_limiter.set_rate(rate, max_rate or max(rate, self._paced_defaults[1]))
+    
+    def _should_pace(self) -> bool:
+        """Whether the next request must wait for the rate limiter."""
+        return self._paced_runs > 0 or self.rate_limiter.throttled
+    
     def _request(
         self, 
         endpoint: str, 
@@ -142,10 +384,15 @@ class APIClient:
         params['key'] = self.api_key
         
         for attempt in range(retry):
+            pace = self._should_pace()
+            if pace:
+                self.rate_limiter.acquire()
             try:
                 response = self.session.get(url, params=params, timeout=self.timeout)
                 response.raise_for_status()
                 data = response.json()
+                if pace:
+                    self.rate_limiter.reward()
                 
                 # API v2 wraps responses in {'response': [...]}
                 if isinstance(data, dict) and 'response' in data:
@@ -154,8 +401,16 @@ class APIClient:
                 return data
                 
             except requests.exceptions.RequestException as e:
+                response = getattr(e, 'response', None)
+                throttled = response is not None and response.status_code == 429
+                if throttled:
+                    self.rate_limiter.penalize(
+                        _parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                
                 if attempt < retry - 1:
-                    wait_time = 2 ** attempt
+                    # The rate limiter already delays throttled retries
+                    wait_time = 0 if throttled else 2 ** attempt
                     logger.warning(
                         f"Request failed (attempt {attempt + 1}/{retry}): {e}. "
                         f"Retrying in {wait_time}s..."
@@ -245,6 +500,146 @@ class APIClient:
         logger.info(f"Retrieved {len(data)} data points")
         return data
     
+    def create_async_session(self, limit: int = 100):
+        """
+        Create an aiohttp session for the async API methods.
+        
+        Args:
+            limit: Maximum number of simultaneous connections
+        
+        Returns:
+            aiohttp.ClientSession (use as an async context manager)
+        
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "Async downloads require aiohttp. "
+                "Install with: pip install iniamet[async]"
+            )
+        
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit),
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def _request_async(
+        self,
+        session,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        retry: int = 3
+    ) -> Any:
+        """
+        Async counterpart of ``_request`` using an aiohttp session.
+        
+        JSON decoding runs in the default executor so the event loop is
+        not blocked by large payloads.
+        
+        Args:
+            session: Session created with ``create_async_session``
+            endpoint: API endpoint (e.g., 'estaciones', 'variables')
+            params: Query parameters
+            retry: Number of retry attempts
+        
+        Returns:
+            Parsed JSON response
+        
+        Raises:
+            aiohttp.ClientError: If request fails after retries
+        """
+        import aiohttp
+        
+        url = f"{self.BASE_URL}/{endpoint}/"
+        params = dict(params or {})
+        params['key'] = self.api_key
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(retry):
+            pace = self._should_pace()
+            if pace:
+                await self.rate_limiter.acquire_async()
+            try:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                
+                data = await loop.run_in_executor(None, _json_loads, body)
+                if pace:
+                    self.rate_limiter.reward()
+                
+                # API v2 wraps responses in {'response': [...]}
+                if isinstance(data, dict) and 'response' in data:
+                    return data['response']
+                
+                return data
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                throttled = isinstance(e, aiohttp.ClientResponseError) and e.status == 429
+                if throttled:
+                    headers = e.headers or {}
+                    self.rate_limiter.penalize(_parse_retry_after(headers.get('Retry-After')))
+                
+                if attempt < retry - 1:
+                    # The rate limiter already delays throttled retries
+                    wait_time = 0 if throttled else 2 ** attempt
+                    logger.warning(
+                        f"Request failed (attempt {attempt + 1}/{retry}): {e}. "
+                        f"Retrying in {wait_time}s..."
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Request failed after {retry} attempts: {e}")
+                    raise
+        
+        return None
+    
+    async def get_data_async(
+        self,
+        session,
+        station: str,
+        variable: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of ``get_data``.
+        
+        Args:
+            session: Session created with ``create_async_session``
+            station: Station code
+            variable: Variable ID
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+        
+        Returns:
+            List of data point dictionaries with 'tiempo' and 'valor'
+        """
+        logger.info(
+            f"Fetching data for {station}/{variable} "
+            f"from {start_date} to {end_date}..."
+        )
+        
+        params = {
+            'estacion': station,
+            'variable': str(variable),
+            'desde': start_date,
+            'hasta': end_date
+        }
+        
+        data = await self._request_async(session, 'muestras', params)
+        
+        if not data or not isinstance(data, list):
+            logger.warning(f"No data found for {station}/{variable}")
+            return []
+        
+        logger.info(f"Retrieved {len(data)} data points")
+        return data
+    
     def close(self):
         """Close the session."""
         self.session.close()
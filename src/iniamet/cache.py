@@ -1,18 +1,24 @@
 """
 Caching system for INIA data.
 
-Provides simple JSON-based caching for stations, variables, and time series data.
+Provides simple file-based caching for stations, variables, and time series data.
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
 
 class CacheManager:
     """Manages local cache for API responses."""
@@ -38,22 +44,33 @@ class CacheManager:
         
         logger.info(f"Cache directory: {self.cache_dir}")
     
-    def get_stations(self) -> Optional[pd.DataFrame]:
+    def get_stations(self, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
         """
         Get cached stations.
         
+        Reads the Parquet cache when pyarrow is installed, falling back to
+        the JSON cache written by older versions or without pyarrow.
+        
+        Args:
+            columns: Optional subset of columns to load
+        
         Returns:
             DataFrame if cache exists, None otherwise
         """
-        cache_file = self.stations_cache / "all_stations.json"
-        
-        if not cache_file.exists():
-            return None
+        parquet_file = self.stations_cache / "all_stations.parquet"
+        json_file = self.stations_cache / "all_stations.json"
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
+            if _HAS_PYARROW and parquet_file.exists():
+                return pd.read_parquet(parquet_file, engine='pyarrow', columns=columns)
+            
+            if not json_file.exists():
+                return None
+            
+            with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return pd.DataFrame(data)
+            df = pd.DataFrame(data)
+            return df[columns] if columns is not None else df
         except Exception as e:
             logger.warning(f"Failed to load stations cache: {e}")
             return None
@@ -62,15 +79,25 @@ class CacheManager:
         """
         Save stations to cache.
         
+        Uses zstd-compressed Parquet (keeping column dtypes) when pyarrow is
+        installed, JSON otherwise.
+        
         Args:
             df: Stations DataFrame
         """
-        cache_file = self.stations_cache / "all_stations.json"
+        parquet_file = self.stations_cache / "all_stations.parquet"
+        json_file = self.stations_cache / "all_stations.json"
         
         try:
-            data = df.to_dict(orient='records')
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if _HAS_PYARROW:
+                df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+                # Drop the legacy JSON cache so it can't go stale
+                if json_file.exists():
+                    json_file.unlink()
+            else:
+                data = df.to_dict(orient='records')
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             logger.info(f"Saved {len(df)} stations to cache")
         except Exception as e:
             logger.error(f"Failed to save stations cache: {e}")
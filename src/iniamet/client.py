@@ -5,7 +5,7 @@ This is the main entry point for the library.
 """
 
 import logging
-from typing import Optional, List, Union, Dict
+from typing import Optional, List, Union, Dict, Tuple, Iterator
 from datetime import datetime
 import pandas as pd
 
@@ -34,7 +34,8 @@ class INIAClient:
         self,
         api_key: Optional[str] = None,
         cache: bool = True,
-        cache_dir: str = "./iniamet_cache"
+        cache_dir: str = "./iniamet_cache",
+        value_dtype: str = 'float64'
     ):
         """
         Initialize INIA client.
@@ -43,11 +44,15 @@ class INIAClient:
             api_key: Optional custom API key
             cache: Enable/disable caching
             cache_dir: Directory for cache files
+            value_dtype: dtype of downloaded 'valor' columns ('float32' halves memory)
         """
         self.api = APIClient(api_key=api_key)
         self.cache_manager = CacheManager(cache_dir=cache_dir) if cache else None
         self.station_manager = StationManager(self.api, self.cache_manager)
-        self.data_downloader = DataDownloader(self.api, self.cache_manager)
+        self.data_downloader = DataDownloader(self.api, self.cache_manager, value_dtype=value_dtype)
+        
+        # Filtered station tables keyed by (region, station_type)
+        self._stations_memo: Dict[Tuple[Optional[str], Optional[str]], pd.DataFrame] = {}
         
         logger.info("INIA Client initialized")
     
@@ -60,6 +65,10 @@ class INIAClient:
         """
         Get list of available stations.
         
+        Results are memoized per (region, station_type) for the lifetime of
+        the client, so repeated lookups (e.g., several RegionalDownloader
+        instances sharing one client) skip filtering and API calls.
+        
         Args:
             region: Filter by region code (e.g., "R16" for Ñuble)
             station_type: Filter by station type (e.g., "INIA", "DMC")
@@ -72,11 +81,37 @@ class INIAClient:
             >>> stations = client.get_stations(region="R16")
             >>> print(stations[['codigo', 'nombre', 'region']])
         """
-        return self.station_manager.get_stations(
+        key = (region, station_type)
+        if force_update:
+            self._stations_memo.clear()
+        elif key in self._stations_memo:
+            return self._stations_memo[key].copy()
+        
+        df = self.station_manager.get_stations(
             region=region,
             station_type=station_type,
             force_update=force_update
         )
+        if not df.empty:
+            self._stations_memo[key] = df
+        
+        return df.copy()
+    
+    def get_station(self, code: str) -> Optional[pd.Series]:
+        """
+        Get a single station by its code.
+        
+        Args:
+            code: Station code (e.g., "INIA-47")
+        
+        Returns:
+            Series with the station's columns, or None if the code is unknown
+        
+        Example:
+            >>> station = client.get_station("INIA-47")
+            >>> print(station['nombre'], station['region'])
+        """
+        return self.station_manager.get_station(code)
     
     def get_variables(
         self,
@@ -109,7 +144,8 @@ class INIAClient:
         start_date: Union[str, datetime],
         end_date: Union[str, datetime],
         use_cache: bool = True,
-        aggregation: Optional[str] = None
+        aggregation: Optional[str] = None,
+        chunk_days: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Download time series data for a station and variable.
@@ -126,6 +162,8 @@ class INIAClient:
                 - 'D' or 'daily': Daily aggregation
                 - 'W': Weekly, 'M': Monthly
                 - Any pandas resample rule
+            chunk_days: Download long ranges in windows of this many days,
+                        holding one window of raw records in memory at a time
             
         Returns:
             DataFrame with columns: tiempo, valor (and valor_min, valor_max for temperature)
@@ -159,7 +197,87 @@ class INIAClient:
             start_date=start_date,
             end_date=end_date,
             use_cache=use_cache,
-            aggregation=aggregation
+            aggregation=aggregation,
+            chunk_days=chunk_days
+        )
+    
+    def get_data_iter(
+        self,
+        station: str,
+        variable: Union[int, str],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        chunk_days: int = 30
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Download raw time series data as a sequence of date windows.
+        
+        Useful for long ranges that do not need to fit in memory at once.
+        Chunks are not cached.
+        
+        Args:
+            station: Station code (e.g., "INIA-47")
+            variable: Variable ID (int) or name (str)
+            start_date: Start date (YYYY-MM-DD or datetime)
+            end_date: End date (YYYY-MM-DD or datetime)
+            chunk_days: Length of each request window in days
+        
+        Yields:
+            DataFrames with columns tiempo, valor, in time order
+        
+        Example:
+            >>> for chunk in client.get_data_iter("INIA-47", VAR_TEMPERATURA_MEDIA,
+            ...                                   "2015-01-01", "2024-12-31"):
+            ...     print(chunk['valor'].max())
+        """
+        return self.data_downloader.get_data_iter(
+            station=station,
+            variable=variable,
+            start_date=start_date,
+            end_date=end_date,
+            chunk_days=chunk_days
+        )
+    
+    def get_data_multi(
+        self,
+        station: str,
+        variables: List[Union[int, str]],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        use_cache: bool = True,
+        aggregation: Optional[str] = None,
+        max_workers: int = 4
+    ) -> pd.DataFrame:
+        """
+        Download several variables for one station as a single wide DataFrame.
+        
+        Args:
+            station: Station code (e.g., "INIA-47")
+            variables: List of variable IDs
+            start_date: Start date (YYYY-MM-DD or datetime)
+            end_date: End date (YYYY-MM-DD or datetime)
+            use_cache: Use cached data if available (default: True)
+            aggregation: Optional temporal aggregation (see ``get_data``)
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            DataFrame with 'tiempo' and each variable's columns suffixed with
+            its ID (e.g., 'valor_2002', 'valor_2001')
+        
+        Example:
+            >>> df = client.get_data_multi(
+            ...     "INIA-47", [VAR_TEMPERATURA_MEDIA, VAR_PRECIPITACION],
+            ...     "2024-09-01", "2024-09-30", aggregation='D'
+            ... )
+        """
+        return self.data_downloader.get_data_multi(
+            station=station,
+            variables=variables,
+            start_date=start_date,
+            end_date=end_date,
+            use_cache=use_cache,
+            aggregation=aggregation,
+            max_workers=max_workers
         )
     
     def bulk_download(
@@ -168,7 +286,7 @@ class INIAClient:
         variables: List[Union[int, str]],
         start_date: Union[str, datetime],
         end_date: Union[str, datetime],
-        delay: float = 0.5
+        delay: Optional[float] = None
     ) -> Dict[str, pd.DataFrame]:
         """
         Download data for multiple stations and variables.
@@ -178,7 +296,8 @@ class INIAClient:
             variables: List of variable IDs
             start_date: Start date
             end_date: End date
-            delay: Delay between requests (seconds) to avoid rate limiting
+            delay: Minimum delay between requests (seconds). By default requests
+                   are paced by the API client's adaptive rate limiter
             
         Returns:
             Dictionary mapping "station_variable" to DataFrames
@@ -199,6 +318,73 @@ class INIAClient:
             delay=delay
         )
     
+    async def bulk_download_async(
+        self,
+        stations: List[str],
+        variables: List[Union[int, str]],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        max_concurrency: int = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download data for multiple stations and variables concurrently.
+        
+        Requires the optional aiohttp dependency (pip install iniamet[async]).
+        
+        Args:
+            stations: List of station codes
+            variables: List of variable IDs
+            start_date: Start date
+            end_date: End date
+            max_concurrency: Maximum number of simultaneous requests
+        
+        Returns:
+            Dictionary mapping "station_variable" to DataFrames
+        
+        Example:
+            >>> import asyncio
+            >>> data = asyncio.run(client.bulk_download_async(
+            ...     stations=["INIA-47", "INIA-139"],
+            ...     variables=[2002, 2001],
+            ...     start_date="2024-09-01",
+            ...     end_date="2024-09-30"
+            ... ))
+        """
+        return await self.data_downloader.bulk_download_async(
+            stations=stations,
+            variables=variables,
+            start_date=start_date,
+            end_date=end_date,
+            max_concurrency=max_concurrency
+        )
+    
+    def bulk_aggregate(
+        self,
+        results: Dict[str, pd.DataFrame],
+        rule: str = 'D',
+        agg_func: str = 'mean'
+    ) -> pd.DataFrame:
+        """
+        Aggregate the output of ``bulk_download`` in a single pass.
+        
+        Args:
+            results: Dictionary mapping "station_variable" to DataFrames
+            rule: Pandas frequency rule (e.g., 'D', 'W', 'M')
+            agg_func: Aggregation function ('mean', 'sum', 'min', 'max')
+        
+        Returns:
+            Long-format DataFrame with columns: variable, tiempo, valor
+        
+        Example:
+            >>> data = client.bulk_download(["INIA-47"], [2002], "2024-09-01", "2024-09-30")
+            >>> daily = client.bulk_aggregate(data, rule='D', agg_func='max')
+        """
+        return self.data_downloader.bulk_aggregate(
+            results=results,
+            rule=rule,
+            agg_func=agg_func
+        )
+    
     def validate_station_variable(
         self,
         station: str,
@@ -4,32 +4,121 @@ Data downloading module.
 Handles time series data retrieval with caching and aggregation support.
 """
 
+import asyncio
 import logging
+import threading
 import time
-from typing import Optional, List, Union, Dict
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import reduce
+from typing import Optional, List, Union, Dict, Tuple, Iterator
+from datetime import datetime, timedelta
 import pandas as pd
 
-from .api_client import APIClient
+from .api_client import APIClient, paced_requests
 from .cache import CacheManager
-from .utils import parse_date
+from .utils import (
+    parse_date,
+    VAR_TEMPERATURA_MEDIA, VAR_TEMPERATURA_SUELO_10CM,
+    VAR_TEMPERATURA_SUPERFICIE, VAR_PRECIPITACION
+)
 
 logger = logging.getLogger(__name__)
 
+# Timestamp format of the API's 'tiempo' field
+API_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Variables aggregated as min/max/mean
+_TEMP_VARS = frozenset({
+    VAR_TEMPERATURA_MEDIA,
+    VAR_TEMPERATURA_SUELO_10CM,
+    VAR_TEMPERATURA_SUPERFICIE,
+})
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas copy-on-write is active (always on from pandas 3.0)."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except KeyError:
+        return False
+
+
+def _memo_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a memoized frame so callers cannot modify the remembered one.
+    
+    Under copy-on-write a shallow copy is enough; otherwise in-place edits
+    (e.g. ``df.loc[...] = x``) would write through to the shared data, so
+    the values are copied.
+    """
+    return df.copy(deep=not _copy_on_write_enabled())
+
+
+def _ensure_time_indexed(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Validate a time series frame and index it by 'tiempo'.
+    
+    Args:
+        df: DataFrame expected to contain a 'tiempo' column
+        
+    Returns:
+        New DataFrame indexed by 'tiempo', or None if df is missing,
+        empty or has no 'tiempo' column
+    """
+    if df is None or df.empty or 'tiempo' not in df.columns:
+        return None
+    return df.set_index('tiempo', drop=True)
+
+
+def _parse_api_times(raw: pd.Series) -> pd.Series:
+    """
+    Parse API timestamps, assuming the usual 'YYYY-MM-DD HH:MM:SS' format.
+    
+    Pinning the format skips per-string format inference; values that do
+    not match it (e.g. ISO 8601 with 'T') are re-parsed with inference.
+    """
+    times = pd.to_datetime(raw, format=API_TIME_FORMAT, errors='coerce', cache=True)
+    retry = times.isna() & raw.notna()
+    if retry.any():
+        times = times.mask(retry, pd.to_datetime(raw[retry], cache=True))
+    return times
+
 
 class DataDownloader:
     """Handles data downloads from INIA API."""
     
-    def __init__(self, api: APIClient, cache: Optional[CacheManager] = None):
+    # Empty API responses are remembered for this long (seconds)
+    NEGATIVE_CACHE_TTL = 3600
+    NEGATIVE_CACHE_SIZE = 1024
+    # Processed results of recent requests are reused for this long (seconds)
+    MEMO_TTL = 3600
+    MEMO_SIZE = 64
+    
+    def __init__(
+        self,
+        api: APIClient,
+        cache: Optional[CacheManager] = None,
+        value_dtype: str = 'float64'
+    ):
         """
         Initialize data downloader.
         
         Args:
             api: API client instance
             cache: Optional cache manager
+            value_dtype: dtype of downloaded 'valor' columns. 'float32' halves
+                         their memory; values keep ~7 significant digits
         """
         self.api = api
         self.cache = cache
+        self.value_dtype = value_dtype
+        self._negative_cache: "OrderedDict[Tuple, float]" = OrderedDict()
+        self._negative_lock = threading.Lock()
+        self._memo: "OrderedDict[Tuple, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
     
     def get_data(
         self,
@@ -38,7 +127,8 @@ class DataDownloader:
         start_date: Union[str, datetime],
         end_date: Union[str, datetime],
         use_cache: bool = True,
-        aggregation: Optional[str] = None
+        aggregation: Optional[str] = None,
+        chunk_days: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Download time series data with optional aggregation.
@@ -56,6 +146,9 @@ class DataDownloader:
                 - 'M': Monthly aggregation
                 - 'H': Hourly aggregation
                 - Any pandas resample rule
+            chunk_days: If given, download the range in windows of this many
+                        days (see ``get_data_iter``) so only one window of raw
+                        API records is held in memory at a time
             
         Returns:
             DataFrame with columns: tiempo (datetime), valor (float)
@@ -87,19 +180,250 @@ class DataDownloader:
         var_str = str(variable)
         
         # Check cache
-        if self.cache and use_cache:
-            df_cached = self.cache.get_data(station, var_str, start_dt, end_dt)
-            if df_cached is not None and not df_cached.empty:
-                logger.info(
-                    f"Using cached data for {station}/{var_str} "
-                    f"({len(df_cached)} records)"
-                )
-                return df_cached
+        memo_key = (station, var_str, start_dt, end_dt, aggregation)
+        if use_cache:
+            df_memo = self._memo_get(memo_key)
+            if df_memo is not None:
+                return df_memo
+            df_cached = self._get_cached(station, var_str, start_dt, end_dt)
+            if df_cached is not None:
+                return self._memo_put(memo_key, df_cached)
+        
+        # Skip requests known to return no data
+        empty_key = (station, var_str, start_dt.date(), end_dt.date())
+        if use_cache and self._is_known_empty(empty_key):
+            logger.info(f"Skipping {station}/{var_str}: no data (cached empty response)")
+            return pd.DataFrame()
         
         # Download from API
         logger.info(f"Downloading data for {station}/{var_str}...")
         
-        data = self.api.get_data(
+        if chunk_days:
+            chunks = list(self._iter_chunks(station, var_str, start_dt, end_dt, chunk_days))
+            data = pd.concat(chunks, ignore_index=True) if chunks else []
+        else:
+            data = self.api.get_data(
+                station=station,
+                variable=var_str,
+                start_date=start_dt.strftime('%Y-%m-%d'),
+                end_date=end_dt.strftime('%Y-%m-%d')
+            )
+        
+        if len(data) == 0:
+            self._remember_empty(empty_key)
+        
+        return self._memo_put(memo_key, self._process_response(station, var_str, data, aggregation))
+    
+    def get_data_iter(
+        self,
+        station: str,
+        variable: Union[int, str],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        chunk_days: int = 30
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Download raw time series data as a sequence of date windows.
+        
+        Each window is a separate API request, converted and yielded before
+        the next one is fetched, so memory is bounded by one window. Chunks
+        are not cached, aggregated or memoized.
+        
+        Args:
+            station: Station code (e.g., "INIA-47")
+            variable: Variable ID (e.g., 2002 for temperature) or name
+            start_date: Start date (YYYY-MM-DD or datetime)
+            end_date: End date (YYYY-MM-DD or datetime)
+            chunk_days: Length of each request window in days
+        
+        Yields:
+            Non-empty DataFrames with columns tiempo, valor, in time order
+            and without overlapping timestamps
+        
+        Example:
+            >>> for chunk in downloader.get_data_iter('INIA-47', 2002,
+            ...                                       '2020-01-01', '2024-12-31'):
+            ...     print(chunk['valor'].max())
+        """
+        if chunk_days < 1:
+            raise ValueError(f"chunk_days must be at least 1, got {chunk_days}")
+        yield from self._iter_chunks(
+            station, str(variable), parse_date(start_date), parse_date(end_date), chunk_days
+        )
+    
+    def _iter_chunks(
+        self,
+        station: str,
+        var_str: str,
+        start_dt: datetime,
+        end_dt: datetime,
+        chunk_days: int
+    ) -> Iterator[pd.DataFrame]:
+        """Fetch [start_dt, end_dt] window by window (see ``get_data_iter``)."""
+        step = timedelta(days=chunk_days)
+        window_start = start_dt
+        last_time = None
+        while True:
+            window_end = min(window_start + step, end_dt)
+            data = self.api.get_data(
+                station=station,
+                variable=var_str,
+                start_date=window_start.strftime('%Y-%m-%d'),
+                end_date=window_end.strftime('%Y-%m-%d')
+            )
+            if data:
+                df = self._records_to_frame(data).sort_values('tiempo')
+                # Windows share their boundary day; drop rows already yielded
+                if last_time is not None:
+                    df = df[df['tiempo'] > last_time]
+                if not df.empty:
+                    last_time = df['tiempo'].max()
+                    yield df.reset_index(drop=True)
+            if window_end >= end_dt:
+                return
+            window_start = window_end
+    
+    def get_data_multi(
+        self,
+        station: str,
+        variables: List[Union[int, str]],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        use_cache: bool = True,
+        aggregation: Optional[str] = None,
+        max_workers: int = 4
+    ) -> pd.DataFrame:
+        """
+        Download several variables for one station as a single wide DataFrame.
+        
+        The API serves one variable per request, so the requests are issued
+        concurrently over the client's keep-alive session and the results are
+        outer-joined on 'tiempo'.
+        
+        Args:
+            station: Station code (e.g., "INIA-47")
+            variables: List of variable IDs
+            start_date: Start date (YYYY-MM-DD or datetime)
+            end_date: End date (YYYY-MM-DD or datetime)
+            use_cache: Use cached data if available (default: True)
+            aggregation: Optional temporal aggregation (see ``get_data``)
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            DataFrame with a 'tiempo' column and, for each variable, its value
+            columns suffixed with the variable ID (e.g., 'valor_2002',
+            'valor_min_2002'). With a single variable the result is the same
+            as ``get_data``. Variables that fail or return no data are skipped.
+        
+        Example:
+            >>> df = downloader.get_data_multi(
+            ...     'INIA-47', [VAR_TEMPERATURA_MEDIA, VAR_PRECIPITACION],
+            ...     '2024-09-01', '2024-09-30', aggregation='D'
+            ... )
+            >>> df[['tiempo', 'valor_2002', 'valor_2001']]
+        """
+        variables = list(variables)
+        if len(variables) == 1:
+            return self.get_data(
+                station, variables[0], start_date, end_date,
+                use_cache=use_cache, aggregation=aggregation
+            )
+        
+        frames = {}
+        workers = max(1, min(max_workers, len(variables)))
+        with paced_requests(self.api), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self.get_data, station, variable, start_date, end_date,
+                    use_cache, aggregation
+                ): variable
+                for variable in variables
+            }
+            
+            for future in as_completed(futures):
+                variable = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.error(f"  ✗ {station}/{variable}: {e}")
+                    continue
+                
+                if not df.empty:
+                    frames[variable] = df
+        
+        # Join in the requested variable order
+        wide = [
+            frames[variable].rename(
+                columns=lambda col, v=variable: col if col == 'tiempo' else f"{col}_{v}"
+            )
+            for variable in variables if variable in frames
+        ]
+        if not wide:
+            return pd.DataFrame()
+        
+        return reduce(lambda left, right: left.merge(right, on='tiempo', how='outer'), wide)
+    
+    async def get_data_async(
+        self,
+        station: str,
+        variable: Union[int, str],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        use_cache: bool = True,
+        aggregation: Optional[str] = None,
+        session=None
+    ) -> pd.DataFrame:
+        """
+        Async version of ``get_data`` (requires aiohttp).
+        
+        Args:
+            station: Station code (e.g., "INIA-47")
+            variable: Variable ID (e.g., 2002 for temperature) or name
+            start_date: Start date (YYYY-MM-DD or datetime)
+            end_date: End date (YYYY-MM-DD or datetime)
+            use_cache: Use cached data if available (default: True)
+            aggregation: Optional temporal aggregation (see ``get_data``)
+            session: Optional session from ``APIClient.create_async_session``.
+                     A temporary session is opened if not provided.
+        
+        Returns:
+            DataFrame with columns: tiempo (datetime), valor (float)
+        
+        Example:
+            >>> import asyncio
+            >>> df = asyncio.run(downloader.get_data_async(
+            ...     'INIA-47', VAR_TEMPERATURA_MEDIA, '2024-09-01', '2024-09-30'
+            ... ))
+        """
+        if session is None:
+            async with self.api.create_async_session() as session:
+                return await self.get_data_async(
+                    station, variable, start_date, end_date,
+                    use_cache=use_cache, aggregation=aggregation, session=session
+                )
+        
+        start_dt = parse_date(start_date)
+        end_dt = parse_date(end_date)
+        var_str = str(variable)
+        
+        memo_key = (station, var_str, start_dt, end_dt, aggregation)
+        if use_cache:
+            df_memo = self._memo_get(memo_key)
+            if df_memo is not None:
+                return df_memo
+            df_cached = self._get_cached(station, var_str, start_dt, end_dt)
+            if df_cached is not None:
+                return self._memo_put(memo_key, df_cached)
+        
+        empty_key = (station, var_str, start_dt.date(), end_dt.date())
+        if use_cache and self._is_known_empty(empty_key):
+            logger.info(f"Skipping {station}/{var_str}: no data (cached empty response)")
+            return pd.DataFrame()
+        
+        logger.info(f"Downloading data for {station}/{var_str}...")
+        
+        data = await self.api.get_data_async(
+            session,
             station=station,
             variable=var_str,
             start_date=start_dt.strftime('%Y-%m-%d'),
@@ -107,19 +431,106 @@ class DataDownloader:
         )
         
         if not data:
-            logger.warning(f"No data found for {station}/{var_str}")
-            return pd.DataFrame()
+            self._remember_empty(empty_key)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        return self._memo_put(memo_key, self._process_response(station, var_str, data, aggregation))
+    
+    def _get_cached(
+        self,
+        station: str,
+        var_str: str,
+        start_dt: datetime,
+        end_dt: datetime
+    ) -> Optional[pd.DataFrame]:
+        """Return cached data for the request, or None on a cache miss."""
+        if not self.cache:
+            return None
+        
+        df_cached = self.cache.get_data(station, var_str, start_dt, end_dt)
+        if df_cached is not None and not df_cached.empty:
+            logger.info(
+                f"Using cached data for {station}/{var_str} "
+                f"({len(df_cached)} records)"
+            )
+            return df_cached
+        
+        return None
+    
+    def _is_known_empty(self, key: Tuple) -> bool:
+        """Check whether a request recently returned no data."""
+        with self._negative_lock:
+            expiry = self._negative_cache.get(key)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del self._negative_cache[key]
+                return False
+            self._negative_cache.move_to_end(key)
+            return True
+    
+    def _remember_empty(self, key: Tuple):
+        """Record an empty response, evicting the least recently used entry."""
+        with self._negative_lock:
+            self._negative_cache[key] = time.monotonic() + self.NEGATIVE_CACHE_TTL
+            self._negative_cache.move_to_end(key)
+            if len(self._negative_cache) > self.NEGATIVE_CACHE_SIZE:
+                self._negative_cache.popitem(last=False)
+    
+    def _memo_get(self, key: Tuple) -> Optional[pd.DataFrame]:
+        """Return a recently produced result for the request, if still fresh."""
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                return None
+            expiry, df = entry
+            if expiry < time.monotonic():
+                del self._memo[key]
+                return None
+            self._memo.move_to_end(key)
+        logger.debug(f"Reusing in-memory result for {key[0]}/{key[1]}")
+        return _memo_copy(df)
+    
+    def _memo_put(self, key: Tuple, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remember a non-empty result, evicting the least recently used entry.
         
-        # Parse tiempo column
-        if 'tiempo' in df.columns:
-            df['tiempo'] = pd.to_datetime(df['tiempo'])
+        Returns a copy (see ``_memo_copy``) so callers modifying the result
+        do not change the remembered frame.
+        """
+        if df.empty:
+            return df
+        with self._memo_lock:
+            self._memo[key] = (time.monotonic() + self.MEMO_TTL, df)
+            self._memo.move_to_end(key)
+            if len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return _memo_copy(df)
+    
+    def _process_response(
+        self,
+        station: str,
+        var_str: str,
+        data: Union[List[dict], pd.DataFrame],
+        aggregation: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Convert raw API records to a DataFrame, aggregate and cache it.
         
-        # Parse valor column
-        if 'valor' in df.columns:
-            df['valor'] = pd.to_numeric(df['valor'], errors='coerce')
+        Args:
+            station: Station code
+            var_str: Variable ID as string
+            data: List of data point dictionaries from the API, or an
+                  already converted DataFrame (chunked downloads)
+            aggregation: Optional temporal aggregation rule
+        
+        Returns:
+            DataFrame with parsed 'tiempo' and 'valor' columns
+        """
+        if len(data) == 0:
+            logger.warning(f"No data found for {station}/{var_str}")
+            return pd.DataFrame()
+        
+        df = data if isinstance(data, pd.DataFrame) else self._records_to_frame(data)
         
         # Sort by time
         if not df.empty:
@@ -136,6 +547,36 @@ class DataDownloader:
         logger.info(f"Downloaded {len(df)} records")
         return df
     
+    def _records_to_frame(self, data: List[dict]) -> pd.DataFrame:
+        """
+        Convert API records to a DataFrame with parsed 'tiempo' and 'valor'.
+        
+        Records are normally just {'tiempo', 'valor'}; those are split into
+        one list per column in a single pass, which avoids the per-record
+        dict handling and dtype inference of ``pd.DataFrame(records)``.
+        Records with other fields take the generic path.
+        """
+        if data[0].keys() == {'tiempo', 'valor'}:
+            try:
+                times = [d['tiempo'] for d in data]
+                values = [d['valor'] for d in data]
+            except KeyError:
+                df = pd.DataFrame(data)
+            else:
+                df = pd.DataFrame({'tiempo': times, 'valor': values})
+        else:
+            df = pd.DataFrame(data)
+        
+        # Parse tiempo column
+        if 'tiempo' in df.columns:
+            df['tiempo'] = _parse_api_times(df['tiempo'])
+        
+        # Parse valor column
+        if 'valor' in df.columns:
+            df['valor'] = pd.to_numeric(df['valor'], errors='coerce').astype(self.value_dtype)
+        
+        return df
+    
     def _apply_aggregation(
         self,
         df: pd.DataFrame,
@@ -153,21 +594,12 @@ class DataDownloader:
         Returns:
             Aggregated DataFrame
         """
-        if df.empty:
-            return df
-        
-        df = df.copy()
-        df.set_index('tiempo', inplace=True)
-        
-        # Import constants to avoid magic numbers
-        from .utils import (
-            VAR_TEMPERATURA_MEDIA, VAR_TEMPERATURA_SUELO_10CM, 
-            VAR_TEMPERATURA_SUPERFICIE, VAR_PRECIPITACION
-        )
+        df = _ensure_time_indexed(df)
+        if df is None:
+            return pd.DataFrame()
         
         # Temperature variables: compute min/max/mean
-        if variable_id in [VAR_TEMPERATURA_MEDIA, VAR_TEMPERATURA_SUELO_10CM, 
-                          VAR_TEMPERATURA_SUPERFICIE]:
+        if variable_id in _TEMP_VARS:
             df_agg = df.resample(rule).agg({
                 'valor': ['mean', 'min', 'max']
             })
@@ -192,7 +624,7 @@ class DataDownloader:
         variables: List[Union[int, str]],
         start_date: Union[str, datetime],
         end_date: Union[str, datetime],
-        delay: float = 0.5
+        delay: Optional[float] = None
     ) -> Dict[str, pd.DataFrame]:
         """
         Download data for multiple stations and variables.
@@ -202,7 +634,9 @@ class DataDownloader:
             variables: List of variable IDs
             start_date: Start date
             end_date: End date
-            delay: Delay between requests (seconds)
+            delay: Minimum delay between requests (seconds). Caps the API
+                client's rate at 1/delay for this download only; by default
+                the client's adaptive rate limiter paces requests.
             
         Returns:
             Dictionary mapping "station_variable" to DataFrames
@@ -210,41 +644,171 @@ class DataDownloader:
         results = {}
         total = len(stations) * len(variables)
         current = 0
+        rate = 1.0 / delay if delay else None
         
         logger.info(f"Bulk download: {len(stations)} stations × {len(variables)} variables = {total} tasks")
         
-        for station in stations:
-            for variable in variables:
-                current += 1
-                key = f"{station}_{variable}"
-                
-                logger.info(f"[{current}/{total}] Downloading {key}...")
-                
-                try:
-                    df = self.get_data(
-                        station=station,
-                        variable=variable,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
+        with paced_requests(self.api, rate=rate, max_rate=rate):
+            for station in stations:
+                for variable in variables:
+                    current += 1
+                    key = f"{station}_{variable}"
                     
-                    if not df.empty:
-                        results[key] = df
-                        logger.info(f"  ✓ {key}: {len(df)} records")
-                    else:
-                        logger.warning(f"  ⚠ {key}: No data")
+                    logger.info(f"[{current}/{total}] Downloading {key}...")
                     
-                    # Rate limiting
-                    if current < total:
-                        time.sleep(delay)
+                    try:
+                        df = self.get_data(
+                            station=station,
+                            variable=variable,
+                            start_date=start_date,
+                            end_date=end_date
+                        )
                         
-                except Exception as e:
-                    logger.error(f"  ✗ {key}: {e}")
-                    continue
+                        if not df.empty:
+                            results[key] = df
+                            logger.info(f"  ✓ {key}: {len(df)} records")
+                        else:
+                            logger.warning(f"  ⚠ {key}: No data")
+                    
+                    except Exception as e:
+                        logger.error(f"  ✗ {key}: {e}")
+                        continue
         
         logger.info(f"Bulk download complete: {len(results)}/{total} successful")
         return results
     
+    async def bulk_download_async(
+        self,
+        stations: List[str],
+        variables: List[Union[int, str]],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        max_concurrency: int = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download data for multiple stations and variables concurrently.
+        
+        Requests share one aiohttp connection pool; at most
+        ``max_concurrency`` of them are in flight at any time, and they are
+        paced by the API client's rate limiter.
+        Requires the optional ``aiohttp`` dependency.
+        
+        Args:
+            stations: List of station codes
+            variables: List of variable IDs
+            start_date: Start date
+            end_date: End date
+            max_concurrency: Maximum number of simultaneous requests
+        
+        Returns:
+            Dictionary mapping "station_variable" to DataFrames
+        
+        Example:
+            >>> import asyncio
+            >>> data = asyncio.run(downloader.bulk_download_async(
+            ...     ["INIA-47", "INIA-139"], [2002, 2001],
+            ...     "2024-09-01", "2024-09-30"
+            ... ))
+        """
+        tasks = [(station, variable) for station in stations for variable in variables]
+        total = len(tasks)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        logger.info(f"Async bulk download: {len(stations)} stations × {len(variables)} variables = {total} tasks")
+        
+        with paced_requests(self.api):
+            async with self.api.create_async_session() as session:
+                async def fetch_one(station, variable):
+                    async with semaphore:
+                        return await self.get_data_async(
+                            station=station,
+                            variable=variable,
+                            start_date=start_date,
+                            end_date=end_date,
+                            session=session
+                        )
+                
+                frames = await asyncio.gather(
+                    *[fetch_one(station, variable) for station, variable in tasks],
+                    return_exceptions=True
+                )
+        
+        results = {}
+        for (station, variable), df in zip(tasks, frames):
+            key = f"{station}_{variable}"
+            
+            if isinstance(df, Exception):
+                logger.error(f"  ✗ {key}: {df}")
+            elif not df.empty:
+                results[key] = df
+                logger.info(f"  ✓ {key}: {len(df)} records")
+            else:
+                logger.warning(f"  ⚠ {key}: No data")
+        
+        logger.info(f"Async bulk download complete: {len(results)}/{total} successful")
+        return results
+    
+    def bulk_aggregate(
+        self,
+        results: Dict[str, pd.DataFrame],
+        rule: str = 'D',
+        agg_func: str = 'mean'
+    ) -> pd.DataFrame:
+        """
+        Aggregate the output of ``bulk_download`` in a single groupby pass.
+        
+        All frames are stacked into one long-format DataFrame with a
+        categorical 'variable' column, so the time index is walked once
+        instead of once per "station_variable" key.
+        
+        Args:
+            results: Dictionary mapping "station_variable" to DataFrames
+                     (as returned by ``bulk_download``)
+            rule: Pandas frequency rule (e.g., 'D', 'W', 'M')
+            agg_func: Aggregation function ('mean', 'sum', 'min', 'max')
+        
+        Returns:
+            Long-format DataFrame with columns: variable, tiempo, valor.
+            Periods without data are omitted.
+        
+        Raises:
+            ValueError: If agg_func is unknown
+        
+        Example:
+            >>> results = downloader.bulk_download(
+            ...     ["INIA-47", "INIA-139"], [2002], "2024-09-01", "2024-09-30"
+            ... )
+            >>> daily = downloader.bulk_aggregate(results, rule='D', agg_func='mean')
+            >>> daily.pivot(index='tiempo', columns='variable', values='valor')
+        """
+        if agg_func not in ('mean', 'sum', 'min', 'max'):
+            raise ValueError(f"Unknown aggregation function: {agg_func}")
+        
+        frames = {
+            key: df[['tiempo', 'valor']]
+            for key, df in results.items()
+            if not df.empty and 'tiempo' in df.columns and 'valor' in df.columns
+        }
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        combined = pd.concat(
+            [df.assign(variable=key) for key, df in frames.items()],
+            ignore_index=True
+        )
+        combined['variable'] = pd.Categorical(
+            combined['variable'], categories=list(frames)
+        )
+        
+        df_agg = combined.groupby(
+            ['variable', pd.Grouper(key='tiempo', freq=rule)],
+            observed=True,
+            sort=False
+        )['valor'].agg(agg_func)
+        
+        return df_agg.reset_index()
+    
     def aggregate_daily(
         self,
         df: pd.DataFrame,
@@ -260,11 +824,9 @@ class DataDownloader:
         Returns:
             Daily aggregated DataFrame
         """
-        if df.empty or 'tiempo' not in df.columns:
-            return df
-        
-        df = df.copy()
-        df.set_index('tiempo', inplace=True)
+        df = _ensure_time_indexed(df)
+        if df is None:
+            return pd.DataFrame()
         
         if agg_func == 'mean':
             df_daily = df.resample('D').mean()
@@ -293,12 +855,10 @@ class DataDownloader:
         Returns:
             Daily DataFrame with columns: tiempo, tmean, tmin, tmax
         """
-        if df.empty or 'tiempo' not in df.columns:
+        df = _ensure_time_indexed(df)
+        if df is None:
             return pd.DataFrame()
         
-        df = df.copy()
-        df.set_index('tiempo', inplace=True)
-        
         df_daily = df.resample('D').agg({
             'valor': ['mean', 'min', 'max']
         })
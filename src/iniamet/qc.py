@@ -5,10 +5,25 @@ Provides high-level functions to detect and filter erroneous data.
 """
 
 import logging
-from typing import Optional, Dict, List, Tuple
+import warnings
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional, Dict, List, Tuple
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +67,313 @@ EXPECTED_RANGES = {
 }
 
 
+# Bit values of the packed 'qc_bits' column (apply_all_checks(packed=True))
+QC_IMPOSSIBLE = 1
+QC_EXTREME = 2
+QC_STUCK = 4
+QC_SUDDEN = 8
+QC_ZEROS = 16
+
+QC_FLAG_BITS = {
+    'qc_impossible': QC_IMPOSSIBLE,
+    'qc_extreme': QC_EXTREME,
+    'qc_stuck': QC_STUCK,
+    'qc_sudden': QC_SUDDEN,
+    'qc_zeros': QC_ZEROS,
+}
+
+# Shift of each flag in the stacked (5, N) mask array, in QC_FLAG_BITS order
+_BIT_SHIFTS = np.arange(len(QC_FLAG_BITS), dtype=np.uint8)[:, None]
+
+# (min, max) tuples for direct unpacking in the range checks
+_PHYSICAL = {k: (v['min'], v['max']) for k, v in PHYSICAL_RANGES.items()}
+_EXPECTED = {k: (v['min'], v['max']) for k, v in EXPECTED_RANGES.items()}
+_UNBOUNDED = (-np.inf, np.inf)
+
+
+@lru_cache(maxsize=64)
+def _normalize(name: str) -> str:
+    """Normalize variable name for lookup."""
+    name = name.lower().strip()
+    
+    # Common variations
+    if 'temp' in name:
+        return 'temperatura'
+    elif 'hum' in name:
+        return 'humedad'
+    elif 'prec' in name or 'lluv' in name:
+        return 'precipitacion'
+    elif 'vient' in name:
+        return 'viento'
+    elif 'radia' in name:
+        return 'radiacion'
+    elif 'presion' in name:
+        return 'presion'
+    
+    return name
+
+
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """
+    Length of the run of equal values each element of a boolean mask belongs to.
+    
+    Args:
+        mask: 1-D boolean array
+    
+    Returns:
+        Integer array (same length as mask) with the run length at each position
+    """
+    n = len(mask)
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+    
+    # Run boundaries: positions where the mask changes value
+    idx = np.flatnonzero(np.r_[True, mask[1:] != mask[:-1], True])
+    lens = np.diff(idx)
+    return np.repeat(lens, lens)
+
+
+def _as_datetime(times: pd.Series) -> pd.Series:
+    """Parse timestamps unless the Series already has a datetime dtype."""
+    if pd.api.types.is_datetime64_any_dtype(times):
+        return times
+    # API timestamps repeat heavily across series; cache=True parses each string once
+    return pd.to_datetime(times, cache=True)
+
+
+def _to_hours(times: pd.Series) -> np.ndarray:
+    """
+    Convert a datetime Series to float hours since the epoch (NaT -> NaN).
+    
+    Args:
+        times: Datetime Series (naive or tz-aware)
+    
+    Returns:
+        float64 array of hours
+    """
+    if getattr(times.dt, 'tz', None) is not None:
+        times = times.dt.tz_convert(None)
+    arr = times.to_numpy(dtype='datetime64[ns]')
+    hours = arr.view('i8').astype(np.float64) / 3.6e12
+    hours[np.isnat(arr)] = np.nan
+    return hours
+
+
+def _sudden_numpy(
+    values: np.ndarray,
+    t_hours: np.ndarray,
+    max_per_hour: float,
+    gap_limit_h: float
+) -> np.ndarray:
+    """Vectorized fallback for ``_sudden_kernel``."""
+    out = np.zeros(len(values), dtype=np.bool_)
+    dt = np.diff(t_hours)
+    dv = np.abs(np.diff(values))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[1:] = (dt > 0) & (dt <= gap_limit_h) & (dv / dt > max_per_hour)
+    return out
+
+
+# Arrays shorter than this skip numexpr (thread start-up dominates)
+NUMEXPR_MIN_SIZE = 200_000
+
+
+def _outside_range(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """
+    Mask of values below lo or above hi (NaN -> False).
+    
+    Uses numexpr when available to fuse both compares and the OR into one
+    multithreaded loop; below ``NUMEXPR_MIN_SIZE`` values its call overhead
+    outweighs that and plain numpy is used.
+    """
+    if _HAS_NUMEXPR and len(values) >= NUMEXPR_MIN_SIZE:
+        return ne.evaluate(
+            '(v < lo) | (v > hi)',
+            local_dict={'v': values, 'lo': float(lo), 'hi': float(hi)}
+        )
+    return (values < lo) | (values > hi)
+
+
+def _stuck_mask(values: np.ndarray, min_repeats: int, tolerance: float) -> np.ndarray:
+    """Persistence test mask (see ``QualityControl.detect_stuck_sensor``)."""
+    if len(values) < min_repeats:
+        return np.zeros(len(values), dtype=bool)
+    
+    is_same = np.empty(len(values), dtype=bool)
+    is_same[0] = False
+    np.less_equal(np.abs(values[1:] - values[:-1]), tolerance, out=is_same[1:])
+    return is_same & (_run_lengths(is_same) >= min_repeats - 1)
+
+
+def _zeros_mask(values: np.ndarray, min_zeros: int) -> np.ndarray:
+    """Consecutive zeros mask (see ``QualityControl.detect_consecutive_zeros``)."""
+    if len(values) < min_zeros:
+        return np.zeros(len(values), dtype=bool)
+    
+    is_zero = values == 0
+    return is_zero & (_run_lengths(is_zero) >= min_zeros)
+
+
+# Max change per hour for non-temperature variables (temperature depends
+# on the data frequency, see _sudden_threshold)
+_SUDDEN_MAX_PER_HOUR = {
+    'humedad': 45.0,      # 45% (Estevez, 2011)
+    'presion': 10.0,      # 10 hPa por hora
+    'radiacion': 555.0,   # 555 W/m² (Meek & Hatfield, 1994)
+    'viento': 10.0,       # 10 m/s (Meek & Hatfield, 1994)
+}
+
+
+def _sudden_threshold(var_key: str, t_hours: np.ndarray) -> float:
+    """
+    Default max change per hour for the temporal consistency test (WMO, 1993).
+    
+    Args:
+        var_key: Normalized variable name
+        t_hours: Timestamps in hours (used to infer data frequency)
+    
+    Returns:
+        Maximum allowed change per hour
+    """
+    if var_key == 'temperatura':
+        # Calculate median time interval to determine data frequency
+        time_diff = np.diff(t_hours)
+        time_diff = time_diff[~np.isnan(time_diff)]
+        median_interval = np.median(time_diff) if time_diff.size else np.nan
+        
+        # Adaptive threshold based on data frequency
+        if median_interval <= 0.5:  # ~15-30 min intervals
+            return 4.0   # 4°C por hora para datos de alta frecuencia
+        return 10.0  # 10°C por hora para datos horarios
+    
+    # Default thresholds for other variables
+    return _SUDDEN_MAX_PER_HOUR.get(var_key, 999.0)
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _sudden_kernel(values, t_hours, max_per_hour, gap_limit_h):
+        """Flag changes faster than max_per_hour in a single pass."""
+        n = len(values)
+        out = np.zeros(n, dtype=np.bool_)
+        for i in range(1, n):
+            dt = t_hours[i] - t_hours[i - 1]
+            if dt > 0 and dt <= gap_limit_h:
+                out[i] = abs(values[i] - values[i - 1]) / dt > max_per_hour
+        return out
+else:
+    _sudden_kernel = _sudden_numpy
+
+
+# Scale factor turning the MAD into a standard deviation estimate (normal data)
+_MAD_SCALE = 1.4826
+
+
+def _hampel_numpy(values: np.ndarray, half_window: int, n_sigma: float) -> np.ndarray:
+    """Hampel outlier mask with numpy (windows are truncated at the edges)."""
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    padded = np.concatenate([np.full(half_window, np.nan), values, np.full(half_window, np.nan)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * half_window + 1)
+    with warnings.catch_warnings():
+        # Windows made only of NaN belong to NaN values, which are never flagged
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median = np.nanmedian(windows, axis=1)
+        mad = np.nanmedian(np.abs(windows - median[:, None]), axis=1)
+    deviation = np.abs(values - median)
+    out = deviation > n_sigma * _MAD_SCALE * mad
+    return out[:n]
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _hampel_kernel(values, half_window, n_sigma):
+        """Hampel outlier mask; each position computes its window median/MAD."""
+        n = len(values)
+        out = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            if np.isnan(values[i]):
+                continue
+            lo = max(0, i - half_window)
+            hi = min(n, i + half_window + 1)
+            window = values[lo:hi]
+            window = window[~np.isnan(window)]
+            median = np.median(window)
+            mad = np.median(np.abs(window - median))
+            out[i] = abs(values[i] - median) > n_sigma * 1.4826 * mad
+        return out
+else:
+    _hampel_kernel = _hampel_numpy
+
+
+def _pack_flags(masks: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Pack the five QC flag masks into uint8 bits (see QC_FLAG_BITS).
+    
+    Args:
+        masks: Dictionary mapping QC_FLAG_BITS names to boolean arrays
+    
+    Returns:
+        uint8 array; 0 means every check passed
+    """
+    # One reduce over a (5, N) uint8 stack
+    flags = np.stack([masks[name] for name in QC_FLAG_BITS]).view(np.uint8)
+    return np.bitwise_or.reduce(flags << _BIT_SHIFTS, axis=0)
+
+
+@dataclass
+class _QCState:
+    """
+    Working data shared by the checks of one QC run.
+    
+    Values are extracted once; checks record their output columns here and
+    ``to_frame`` adds them all to a single shallow copy of the input.
+    """
+    df: pd.DataFrame
+    values: np.ndarray
+    flag_dtype: Optional[str] = None
+    columns: Dict[str, Any] = field(default_factory=dict)
+    t_hours: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        value_col: str,
+        flag_dtype: Optional[str] = None
+    ) -> "_QCState":
+        """Build state from a DataFrame's value column (float32 is kept as is)."""
+        column = df[value_col]
+        dtype = np.float32 if column.dtype == np.float32 else np.float64
+        return cls(
+            df=df,
+            values=column.to_numpy(dtype=dtype, na_value=np.nan),
+            flag_dtype=flag_dtype
+        )
+    
+    def add(self, name: str, column: np.ndarray) -> np.ndarray:
+        """Record an output column and return it."""
+        self.columns[name] = column
+        return column
+    
+    def hours(self, time_col: str) -> np.ndarray:
+        """Timestamps as float hours, parsing the time column once."""
+        if self.t_hours is None:
+            times = self.add(time_col, _as_datetime(self.df[time_col]))
+            self.t_hours = _to_hours(times)
+        return self.t_hours
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Return a shallow copy of the input with the recorded columns."""
+        df = self.df.copy(deep=False)
+        for name, column in self.columns.items():
+            if self.flag_dtype and isinstance(column, np.ndarray) and column.dtype == np.bool_:
+                column = pd.array(column, dtype=self.flag_dtype)
+            df[name] = column
+        return df
+
+
 class QualityControl:
     """
     Quality control for meteorological data.
@@ -62,11 +384,33 @@ class QualityControl:
     - Stuck sensors (repeated values)
     - Sudden unrealistic changes
     - Consecutive zeros
+    
+    Checks return a shallow copy of the input with the flag columns added;
+    existing columns share memory with the caller's frame. Copy the input
+    beforehand if you need to modify values in place afterwards.
     """
     
-    def __init__(self):
-        """Initialize QC engine."""
+    def __init__(self, flag_dtype: Optional[str] = None):
+        """
+        Initialize QC engine.
+        
+        Args:
+            flag_dtype: Optional dtype for the bool flag columns. Use
+                        'bool[pyarrow]' (requires pyarrow) to store flags as
+                        1-bit Arrow booleans instead of 1-byte NumPy bools.
+        
+        Example:
+            >>> qc = QualityControl(flag_dtype='bool[pyarrow]')
+            >>> df_qc = qc.apply_all_checks(df)
+        """
         self.qc_flags = []
+        self.flag_dtype = flag_dtype
+    
+    def _as_flag(self, mask: np.ndarray):
+        """Convert a boolean mask to the configured flag dtype."""
+        if self.flag_dtype:
+            return pd.array(mask, dtype=self.flag_dtype)
+        return mask
     
     def detect_impossible_values(
         self,
@@ -90,26 +434,9 @@ class QualityControl:
             >>> df_clean = qc.detect_impossible_values(df, 'temperatura')
             >>> print(f"Invalid values: {df_clean['qc_impossible'].sum()}")
         """
-        df = df.copy()
-        
-        # Get physical range
-        var_key = self._normalize_variable_name(variable_name)
-        ranges = PHYSICAL_RANGES.get(var_key, {'min': -np.inf, 'max': np.inf})
-        
-        # Flag impossible values
-        df['qc_impossible'] = (
-            (df[value_col] < ranges['min']) | 
-            (df[value_col] > ranges['max'])
-        )
-        
-        n_invalid = df['qc_impossible'].sum()
-        if n_invalid > 0:
-            logger.warning(
-                f"Found {n_invalid} physically impossible values "
-                f"(outside {ranges['min']}-{ranges['max']})"
-            )
-        
-        return df
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_impossible(state, _normalize(variable_name))
+        return state.to_frame()
     
     def detect_extreme_values(
         self,
@@ -130,38 +457,16 @@ class QualityControl:
         Returns:
             DataFrame with added column 'qc_extreme' (True = outlier)
             
+        Raises:
+            ValueError: If method is not 'range' or 'iqr'
+        
         Example:
             >>> qc = QualityControl()
             >>> df_clean = qc.detect_extreme_values(df, 'temperatura')
         """
-        df = df.copy()
-        
-        if method == 'range':
-            # Test de rango fijo (WMO, 1993)
-            var_key = self._normalize_variable_name(variable_name)
-            ranges = EXPECTED_RANGES.get(var_key, {'min': -np.inf, 'max': np.inf})
-            
-            df['qc_extreme'] = (
-                (df[value_col] < ranges['min']) | 
-                (df[value_col] > ranges['max'])
-            )
-        
-        elif method == 'iqr':
-            # Use IQR method
-            Q1 = df[value_col].quantile(0.25)
-            Q3 = df[value_col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            df['qc_extreme'] = (
-                (df[value_col] < (Q1 - 3 * IQR)) | 
-                (df[value_col] > (Q3 + 3 * IQR))
-            )
-        
-        n_extreme = df['qc_extreme'].sum()
-        if n_extreme > 0:
-            logger.warning(f"Found {n_extreme} extreme values (WMO fixed range test)")
-        
-        return df
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_extreme(state, _normalize(variable_name), method)
+        return state.to_frame()
     
     def detect_stuck_sensor(
         self,
@@ -188,28 +493,9 @@ class QualityControl:
             >>> qc = QualityControl()
             >>> df_clean = qc.detect_stuck_sensor(df, min_repeats=4)
         """
-        df = df.copy()
-        df['qc_stuck'] = False
-        
-        if len(df) < min_repeats:
-            return df
-        
-        # Find consecutive repeats (Test de persistencia)
-        diff = df[value_col].diff().abs()
-        is_same = diff <= tolerance
-        
-        # Count consecutive
-        groups = (is_same != is_same.shift()).cumsum()
-        repeat_counts = is_same.groupby(groups).transform('sum')
-        
-        # Flag if >= min_repeats (4 horas por defecto - Meek & Hatfield, 1994)
-        df['qc_stuck'] = (is_same) & (repeat_counts >= min_repeats - 1)
-        
-        n_stuck = df['qc_stuck'].sum()
-        if n_stuck > 0:
-            logger.warning(f"Found {n_stuck} stuck sensor readings (persistence test)")
-        
-        return df
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_stuck(state, min_repeats, tolerance)
+        return state.to_frame()
     
     def detect_sudden_changes(
         self,
@@ -241,53 +527,9 @@ class QualityControl:
             >>> qc = QualityControl()
             >>> df_clean = qc.detect_sudden_changes(df, 'temperatura')
         """
-        df = df.copy()
-        df['qc_sudden'] = False
-        
-        if len(df) < 2:
-            return df
-        
-        # Calculate time differences in hours
-        df[time_col] = pd.to_datetime(df[time_col])
-        time_diff = df[time_col].diff().dt.total_seconds() / 3600
-        
-        # Calculate median time interval to determine data frequency
-        median_interval = time_diff.median()
-        
-        # Thresholds según test de consistencia temporal (WMO, 1993)
-        if max_change_per_hour is None:
-            var_key = self._normalize_variable_name(variable_name)
-            
-            if var_key == 'temperatura':
-                # Adaptive threshold based on data frequency
-                if median_interval <= 0.5:  # ~15-30 min intervals
-                    max_change_per_hour = 4.0   # 4°C por hora para datos de alta frecuencia
-                else:  # hourly or coarser
-                    max_change_per_hour = 10.0  # 10°C por hora para datos horarios
-            else:
-                # Default thresholds for other variables
-                thresholds = {
-                    'humedad': 45.0,      # 45% (Estevez, 2011)
-                    'presion': 10.0,      # 10 hPa por hora
-                    'radiacion': 555.0,   # 555 W/m² (Meek & Hatfield, 1994)
-                    'viento': 10.0,       # 10 m/s (Meek & Hatfield, 1994)
-                }
-                max_change_per_hour = thresholds.get(var_key, 999.0)
-        
-        # Calculate value changes
-        value_diff = df[value_col].diff().abs()
-        
-        # Rate of change per hour (Test de consistencia temporal)
-        change_rate = value_diff / time_diff.replace(0, np.nan)
-        
-        # Flag sudden changes, but ignore if gap > 2 hours (to avoid false positives from missing data)
-        df['qc_sudden'] = (change_rate > max_change_per_hour) & (time_diff <= 2.0)
-        
-        n_sudden = df['qc_sudden'].sum()
-        if n_sudden > 0:
-            logger.warning(f"Found {n_sudden} sudden changes (temporal consistency test, >{max_change_per_hour:.1f}/h, gaps <=2h)")
-        
-        return df
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_sudden(state, _normalize(variable_name), time_col, max_change_per_hour)
+        return state.to_frame()
     
     def detect_consecutive_zeros(
         self,
@@ -310,27 +552,161 @@ class QualityControl:
             >>> qc = QualityControl()
             >>> df_clean = qc.detect_consecutive_zeros(df, min_zeros=5)
         """
-        df = df.copy()
-        df['qc_zeros'] = False
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_zeros(state, min_zeros)
+        return state.to_frame()
+    
+    def detect_hampel_outliers(
+        self,
+        df: pd.DataFrame,
+        value_col: str = 'valor',
+        window: int = 5,
+        n_sigma: float = 3.0
+    ) -> pd.DataFrame:
+        """
+        Detect local outliers with a Hampel filter (rolling median/MAD).
         
-        if len(df) < min_zeros:
-            return df
+        A value is flagged when it deviates from the median of its centered
+        window by more than ``n_sigma`` scaled MADs. Windows are truncated at
+        the edges of the series and NaN values are never flagged.
+        
+        Args:
+            df: DataFrame with time series data
+            value_col: Column name containing values
+            window: Window length in samples (centered on each value)
+            n_sigma: Number of scaled MADs tolerated
+        
+        Returns:
+            DataFrame with added column 'qc_hampel' (True = outlier)
         
-        # Find zeros
-        is_zero = df[value_col] == 0
+        Example:
+            >>> qc = QualityControl()
+            >>> df_clean = qc.detect_hampel_outliers(df, window=7)
+        """
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        self._run_hampel(state, window, n_sigma)
+        return state.to_frame()
+    
+    def _run_impossible(self, state: "_QCState", var_key: str) -> np.ndarray:
+        """Physical range test on shared state; records 'qc_impossible'."""
+        # Get physical range
+        lo, hi = _PHYSICAL.get(var_key, _UNBOUNDED)
         
-        # Count consecutive
-        groups = (is_zero != is_zero.shift()).cumsum()
-        zero_counts = is_zero.groupby(groups).transform('sum')
+        # Flag impossible values
+        mask = state.add('qc_impossible', _outside_range(state.values, lo, hi))
+        
+        n_invalid = np.count_nonzero(mask)
+        if n_invalid > 0:
+            logger.warning(
+                f"Found {n_invalid} physically impossible values "
+                f"(outside {lo}-{hi})"
+            )
+        
+        return mask
+    
+    def _run_extreme(self, state: "_QCState", var_key: str, method: str = 'range') -> np.ndarray:
+        """Expected range / IQR test on shared state; records 'qc_extreme'."""
+        values = state.values
+        
+        if method == 'range':
+            # Test de rango fijo (WMO, 1993)
+            lo, hi = _EXPECTED.get(var_key, _UNBOUNDED)
+        
+        elif method == 'iqr':
+            # Use IQR method (both quartiles from one partial sort)
+            present = values[~np.isnan(values)]
+            if present.size:
+                Q1, Q3 = np.percentile(present, [25, 75])
+            else:
+                Q1 = Q3 = np.nan
+            IQR = Q3 - Q1
+            lo, hi = Q1 - 3 * IQR, Q3 + 3 * IQR
         
-        # Flag if >= min_zeros
-        df['qc_zeros'] = (is_zero) & (zero_counts >= min_zeros)
+        else:
+            raise ValueError(f"Unknown method: {method}. Use 'range' or 'iqr'")
         
-        n_zeros = df['qc_zeros'].sum()
+        mask = state.add('qc_extreme', _outside_range(values, lo, hi))
+        
+        n_extreme = np.count_nonzero(mask)
+        if n_extreme > 0:
+            logger.warning(f"Found {n_extreme} extreme values (WMO fixed range test)")
+        
+        return mask
+    
+    def _run_stuck(
+        self,
+        state: "_QCState",
+        min_repeats: int = 4,
+        tolerance: float = 0.001
+    ) -> np.ndarray:
+        """Persistence test on shared state; records 'qc_stuck'."""
+        # Find consecutive repeats (Test de persistencia).
+        # Flag if >= min_repeats (4 horas por defecto - Meek & Hatfield, 1994)
+        mask = state.add('qc_stuck', _stuck_mask(state.values, min_repeats, tolerance))
+        
+        n_stuck = np.count_nonzero(mask)
+        if n_stuck > 0:
+            logger.warning(f"Found {n_stuck} stuck sensor readings (persistence test)")
+        
+        return mask
+    
+    def _run_sudden(
+        self,
+        state: "_QCState",
+        var_key: str,
+        time_col: str = 'tiempo',
+        max_change_per_hour: Optional[float] = None
+    ) -> np.ndarray:
+        """Temporal consistency test on shared state; records 'qc_sudden'."""
+        if len(state.values) < 2:
+            return state.add('qc_sudden', np.zeros(len(state.values), dtype=bool))
+        
+        # Calculate time differences in hours
+        t_hours = state.hours(time_col)
+        
+        # Thresholds según test de consistencia temporal (WMO, 1993)
+        if max_change_per_hour is None:
+            max_change_per_hour = _sudden_threshold(var_key, t_hours)
+        
+        # Rate of change per hour (Test de consistencia temporal).
+        # Flag sudden changes, but ignore if gap > 2 hours (to avoid false positives from missing data)
+        mask = state.add(
+            'qc_sudden',
+            _sudden_kernel(state.values, t_hours, float(max_change_per_hour), 2.0)
+        )
+        
+        n_sudden = np.count_nonzero(mask)
+        if n_sudden > 0:
+            logger.warning(f"Found {n_sudden} sudden changes (temporal consistency test, >{max_change_per_hour:.1f}/h, gaps <=2h)")
+        
+        return mask
+    
+    def _run_zeros(self, state: "_QCState", min_zeros: int = 10) -> np.ndarray:
+        """Consecutive zeros test on shared state; records 'qc_zeros'."""
+        # Flag runs of >= min_zeros zeros
+        mask = state.add('qc_zeros', _zeros_mask(state.values, min_zeros))
+        
+        n_zeros = np.count_nonzero(mask)
         if n_zeros > 0:
             logger.warning(f"Found {n_zeros} suspicious consecutive zeros")
         
-        return df
+        return mask
+    
+    def _run_hampel(
+        self,
+        state: "_QCState",
+        window: int = 5,
+        n_sigma: float = 3.0
+    ) -> np.ndarray:
+        """Hampel filter on shared state; records 'qc_hampel'."""
+        values = np.ascontiguousarray(state.values)
+        mask = state.add('qc_hampel', _hampel_kernel(values, window // 2, float(n_sigma)))
+        
+        n_outliers = np.count_nonzero(mask)
+        if n_outliers > 0:
+            logger.warning(f"Found {n_outliers} Hampel outliers (window={window})")
+        
+        return mask
     
     def check_internal_consistency_temperature(
         self,
@@ -353,23 +729,28 @@ class QualityControl:
         Returns:
             DataFrame con columna 'qc_temp_consistency' (True = inconsistente)
         """
-        df = df.copy()
+        df = df.copy(deep=False)
         
         # Verificar que existan las columnas necesarias
         required = [tmin_col, tmean_col, tmax_col]
         if not all(col in df.columns for col in required):
             logger.warning("Missing temperature columns for internal consistency check")
-            df['qc_temp_consistency'] = False
+            df['qc_temp_consistency'] = self._as_flag(np.zeros(len(df), dtype=bool))
             return df
         
-        # Test: Tmax > Tmean > Tmin (WMO, 1993; Feng et al., 2004)
-        df['qc_temp_consistency'] = (
-            (df[tmax_col] <= df[tmean_col]) |
-            (df[tmean_col] <= df[tmin_col]) |
-            (df[tmax_col] <= df[tmin_col])
-        )
+        # Test: Tmax > Tmean > Tmin (WMO, 1993; Feng et al., 2004).
+        # The Tmax <= Tmin compare is only redundant when Tmean is present, so
+        # it is kept to flag rows with a missing Tmean. Fused into one buffer.
+        tmin = df[tmin_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        tmean = df[tmean_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        tmax = df[tmax_col].to_numpy(dtype=np.float64, na_value=np.nan)
         
-        n_inconsistent = df['qc_temp_consistency'].sum()
+        bad = np.less_equal(tmax, tmean)
+        bad |= np.less_equal(tmean, tmin)
+        bad |= np.less_equal(tmax, tmin)
+        df['qc_temp_consistency'] = self._as_flag(bad)
+        
+        n_inconsistent = np.count_nonzero(bad)
         if n_inconsistent > 0:
             logger.warning(f"Found {n_inconsistent} temperature internal consistency violations (Tmax > Tmean > Tmin)")
         
@@ -398,20 +779,25 @@ class QualityControl:
         Returns:
             DataFrame con columna 'qc_wind_consistency' (True = inconsistente)
         """
-        df = df.copy()
-        df['qc_wind_consistency'] = False
+        df = df.copy(deep=False)
+        bad = np.zeros(len(df), dtype=bool)
+        
+        def _values(col):
+            return df[col].to_numpy(dtype=np.float64, na_value=np.nan)
         
         # Test 1: Viento_max > Viento_medio
         if wind_col in df.columns and wind_max_col in df.columns:
-            df.loc[df[wind_max_col] < df[wind_col], 'qc_wind_consistency'] = True
+            bad |= _values(wind_max_col) < _values(wind_col)
         
         # Test 2: Si Viento = 0, entonces Dirección = 0
         if wind_col in df.columns and direction_col in df.columns:
-            wind_zero = df[wind_col].abs() < 0.01
-            direction_nonzero = df[direction_col].abs() > 0.01
-            df.loc[wind_zero & direction_nonzero, 'qc_wind_consistency'] = True
+            wind_zero = np.abs(_values(wind_col)) < 0.01
+            wind_zero &= np.abs(_values(direction_col)) > 0.01
+            bad |= wind_zero
         
-        n_inconsistent = df['qc_wind_consistency'].sum()
+        df['qc_wind_consistency'] = self._as_flag(bad)
+        
+        n_inconsistent = np.count_nonzero(bad)
         if n_inconsistent > 0:
             logger.warning(f"Found {n_inconsistent} wind internal consistency violations")
         
@@ -422,7 +808,8 @@ class QualityControl:
         df: pd.DataFrame,
         variable_name: str = 'temperatura',
         value_col: str = 'valor',
-        time_col: str = 'tiempo'
+        time_col: str = 'tiempo',
+        packed: bool = False
     ) -> pd.DataFrame:
         """
         Apply all quality control checks.
@@ -432,36 +819,58 @@ class QualityControl:
             variable_name: Variable type
             value_col: Column name containing values
             time_col: Column name containing timestamps
+            packed: If True, store the five flags as bits of a single uint8
+                    'qc_bits' column (see QC_FLAG_BITS; 0 = good data) instead
+                    of one bool column per flag plus 'qc_passed'
             
         Returns:
-            DataFrame with QC flags and 'qc_passed' column (True = good data)
+            DataFrame with QC flags and 'qc_passed' column (True = good data),
+            or with a 'qc_bits' column if packed=True
             
         Example:
             >>> qc = QualityControl()
             >>> df_clean = qc.apply_all_checks(df, 'temperatura')
             >>> good_data = df_clean[df_clean['qc_passed']]
             >>> print(f"Passed QC: {len(good_data)}/{len(df_clean)}")
+            >>> 
+            >>> df_bits = qc.apply_all_checks(df, 'temperatura', packed=True)
+            >>> good_data = df_bits[df_bits['qc_bits'] == 0]
         """
-        # Apply all checks
-        df = self.detect_impossible_values(df, variable_name, value_col)
-        df = self.detect_extreme_values(df, variable_name, value_col)
-        df = self.detect_stuck_sensor(df, value_col)
-        df = self.detect_sudden_changes(df, variable_name, value_col, time_col)
-        df = self.detect_consecutive_zeros(df, value_col)
-        
-        # Combined flag: passed if no flags are True
-        df['qc_passed'] = ~(
-            df['qc_impossible'] | 
-            df['qc_extreme'] | 
-            df['qc_stuck'] | 
-            df['qc_sudden'] | 
-            df['qc_zeros']
-        )
+        if df.empty:
+            # Nothing to check: add the empty output columns directly
+            state = _QCState(df=df, values=np.empty(0), flag_dtype=self.flag_dtype)
+            if packed:
+                state.add('qc_bits', np.zeros(0, dtype=np.uint8))
+            else:
+                for name in (*QC_FLAG_BITS, 'qc_passed'):
+                    state.add(name, np.zeros(0, dtype=bool))
+            return state.to_frame()
+        
+        # One shared state: values extracted once, columns added in one shallow copy
+        state = _QCState.from_frame(df, value_col, self.flag_dtype)
+        var_key = _normalize(variable_name)
+        
+        masks = {
+            'qc_impossible': self._run_impossible(state, var_key),
+            'qc_extreme': self._run_extreme(state, var_key),
+            'qc_stuck': self._run_stuck(state),
+            'qc_sudden': self._run_sudden(state, var_key, time_col),
+            'qc_zeros': self._run_zeros(state),
+        }
+        bits = _pack_flags(masks)
+        
+        if packed:
+            for name in masks:
+                state.columns.pop(name)
+            state.add('qc_bits', bits)
+        else:
+            state.add('qc_passed', bits == 0)
+        df = state.to_frame()
         
         # Summary
         n_total = len(df)
-        n_passed = df['qc_passed'].sum()
-        n_failed = n_total - n_passed
+        n_failed = np.count_nonzero(bits)
+        n_passed = n_total - n_failed
         
         logger.info(f"QC Summary: {n_passed}/{n_total} passed ({n_failed} flagged)")
         
@@ -483,14 +892,29 @@ class QualityControl:
             >>> summary = qc.get_qc_summary(df_clean)
             >>> print(summary)
         """
+        counts = dict.fromkeys(QC_FLAG_BITS, 0)
+        
+        if 'qc_bits' in df:
+            # Count every bit in one pass over the packed column
+            bits = df['qc_bits'].to_numpy(dtype=np.uint8)
+            per_bit = np.unpackbits(bits[:, None], axis=1, bitorder='little').sum(axis=0)
+            counts.update(zip(QC_FLAG_BITS, per_bit.tolist()))
+            passed = len(bits) - int(np.count_nonzero(bits))
+        else:
+            # One column-wise sum over the stacked flag columns
+            cols = [col for col in QC_FLAG_BITS if col in df]
+            if cols:
+                counts.update(zip(cols, df[cols].to_numpy(dtype=bool).sum(axis=0).tolist()))
+            passed = int(np.count_nonzero(df['qc_passed'].to_numpy(dtype=bool))) if 'qc_passed' in df else 0
+        
         summary = {
             'total': len(df),
-            'passed': df['qc_passed'].sum() if 'qc_passed' in df else 0,
-            'impossible': df['qc_impossible'].sum() if 'qc_impossible' in df else 0,
-            'extreme': df['qc_extreme'].sum() if 'qc_extreme' in df else 0,
-            'stuck': df['qc_stuck'].sum() if 'qc_stuck' in df else 0,
-            'sudden': df['qc_sudden'].sum() if 'qc_sudden' in df else 0,
-            'zeros': df['qc_zeros'].sum() if 'qc_zeros' in df else 0,
+            'passed': passed,
+            'impossible': counts['qc_impossible'],
+            'extreme': counts['qc_extreme'],
+            'stuck': counts['qc_stuck'],
+            'sudden': counts['qc_sudden'],
+            'zeros': counts['qc_zeros'],
         }
         
         return summary
@@ -498,23 +922,7 @@ class QualityControl:
     @staticmethod
     def _normalize_variable_name(name: str) -> str:
         """Normalize variable name for lookup."""
-        name = name.lower().strip()
-        
-        # Common variations
-        if 'temp' in name:
-            return 'temperatura'
-        elif 'hum' in name:
-            return 'humedad'
-        elif 'prec' in name or 'lluv' in name:
-            return 'precipitacion'
-        elif 'vient' in name:
-            return 'viento'
-        elif 'radia' in name:
-            return 'radiacion'
-        elif 'presion' in name:
-            return 'presion'
-        
-        return name
+        return _normalize(name)
 
 
 # High-level convenience functions
@@ -523,7 +931,8 @@ def apply_quality_control(
     variable_name: str = 'temperatura',
     value_col: str = 'valor',
     time_col: str = 'tiempo',
-    return_clean_only: bool = True
+    return_clean_only: bool = True,
+    hampel_window: Optional[int] = None
 ) -> pd.DataFrame:
     """
     High-level function to apply quality control filters.
@@ -534,6 +943,8 @@ def apply_quality_control(
         value_col: Column containing values
         time_col: Column containing timestamps
         return_clean_only: If True, return only data that passed QC
+        hampel_window: If given, also reject Hampel outliers found with a
+                       window of this many samples (adds 'qc_hampel')
         
     Returns:
         DataFrame with QC flags (or only clean data)
@@ -546,12 +957,40 @@ def apply_quality_control(
     qc = QualityControl()
     df_qc = qc.apply_all_checks(df, variable_name, value_col, time_col)
     
+    if hampel_window is not None:
+        df_qc = qc.detect_hampel_outliers(df_qc, value_col, window=hampel_window)
+        df_qc['qc_passed'] = df_qc['qc_passed'] & ~df_qc['qc_hampel']
+    
     if return_clean_only:
-        return df_qc[df_qc['qc_passed']].copy()
+        # take() returns an independent frame in one pass (no SettingWithCopy
+        # tracking), unlike a boolean mask followed by .copy()
+        return df_qc.take(np.flatnonzero(df_qc['qc_passed'].to_numpy(dtype=bool)))
     else:
         return df_qc
 
 
+def unpack_qc_flags(df: pd.DataFrame, bits_col: str = 'qc_bits') -> pd.DataFrame:
+    """
+    Expand a packed 'qc_bits' column into the individual bool flag columns.
+    
+    Args:
+        df: DataFrame from ``apply_all_checks(..., packed=True)``
+        bits_col: Column containing the packed flags
+    
+    Returns:
+        DataFrame with qc_impossible, qc_extreme, qc_stuck, qc_sudden,
+        qc_zeros and qc_passed columns added
+    
+    Example:
+        >>> df_bits = QualityControl().apply_all_checks(df, packed=True)
+        >>> df_flags = unpack_qc_flags(df_bits)
+    """
+    bits = df[bits_col].to_numpy()
+    flags = {name: (bits & bit) != 0 for name, bit in QC_FLAG_BITS.items()}
+    flags['qc_passed'] = bits == 0
+    return df.assign(**flags)
+
+
 def get_qc_report(df: pd.DataFrame) -> str:
     """
     Generate a text report of QC results.
@@ -5,10 +5,12 @@ Simplifies downloading data for entire regions with common climate variables.
 """
 
 import logging
-from typing import Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Union, Dict
 from datetime import datetime
 import pandas as pd
 
+from .api_client import paced_requests
 from .client import INIAClient
 from .utils import (
     parse_date, normalize_text,
@@ -68,7 +70,9 @@ class RegionalDownloader:
         end_date: Union[str, datetime],
         variables: Optional[List[str]] = None,
         aggregation: str = 'daily',
-        station_filter: Optional[List[str]] = None
+        station_filter: Optional[List[str]] = None,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = None
     ) -> pd.DataFrame:
         """
         Download and consolidate climate data for region.
@@ -80,9 +84,18 @@ class RegionalDownloader:
                       If None, downloads temperature and precipitation
             aggregation: 'daily', 'raw', or pandas resample rule (e.g., 'W', 'M')
             station_filter: Optional list of specific station codes to download
+            max_workers: Number of concurrent download threads. Requests are
+                         paced through the client's rate limiter, so raising
+                         this beyond the API's tolerance will not speed
+                         things up
+            rate_limit: Optional starting requests per second for this
+                        download; defaults to the client's configured
+                        ``rate_limit``, from which the limiter ramps up
             
         Returns:
-            Consolidated DataFrame with all stations and variables
+            Consolidated DataFrame with all stations and variables. When
+            several variables are requested, their columns are suffixed with
+            the variable ID (e.g., 'valor_2002', 'valor_2001').
             
         Example:
             >>> downloader = RegionalDownloader("R16")
@@ -120,113 +133,129 @@ class RegionalDownloader:
             logger.error("No stations to download")
             return pd.DataFrame()
         
-        # Download data for each station
-        all_data = []
+        # Convert aggregation format
+        agg_rule = None
+        if aggregation and aggregation != 'raw':
+            if aggregation == 'daily':
+                agg_rule = 'D'
+            else:
+                agg_rule = aggregation
         
-        for idx, station_row in stations_to_use.iterrows():
-            station_code = station_row['codigo']
-            station_name = station_row['nombre']
-            
-            logger.info(f"[{idx+1}/{len(stations_to_use)}] {station_code} - {station_name}")
-            
-            station_data = {
-                'estacion_codigo': station_code,
-                'estacion_nombre': station_name,
-                'region': station_row['region'],
-                'latitud': station_row['latitud'],
-                'longitud': station_row['longitud'],
-                'elevacion': station_row['elevacion']
+        # Download stations concurrently; requests are I/O-bound. Each task
+        # fetches the variables of one station sequentially as a single wide
+        # frame, so at most max_workers requests are in flight.
+        station_codes = stations_to_use['codigo'].tolist()
+        results: Dict[str, pd.DataFrame] = {}
+        total = len(station_codes)
+        
+        logger.info(
+            f"Downloading {total} stations × {len(var_ids)} variables "
+            f"({max_workers} workers)"
+        )
+        
+        api = getattr(self.client, 'api', None)
+        with paced_requests(api, rate=rate_limit), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_station, station_code, var_ids, start_date, end_date, agg_rule
+                ): station_code
+                for station_code in station_codes
             }
             
-            # Download each variable
-            for var_id in var_ids:
+            for done, future in enumerate(as_completed(futures), start=1):
+                station_code = futures[future]
                 try:
-                    # Convert aggregation format
-                    agg_rule = None
-                    if aggregation and aggregation != 'raw':
-                        if aggregation == 'daily':
-                            agg_rule = 'D'
-                        else:
-                            agg_rule = aggregation
-                    
-                    # Use client's built-in aggregation
-                    df = self.client.get_data(
-                        station=station_code,
-                        variable=var_id,
-                        start_date=start_date,
-                        end_date=end_date,
-                        aggregation=agg_rule
-                    )
-                    
-                    if df.empty:
-                        logger.warning(f"  No data for variable {var_id}")
-                        continue
-                    
-                    # Add variable columns to station data
-                    for col in df.columns:
-                        if col != 'tiempo':
-                            station_data[col] = df[col].values
-                    
-                    if 'tiempo' not in station_data:
-                        station_data['tiempo'] = df['tiempo'].values
-                    
-                    logger.info(f"  ✓ Variable {var_id}: {len(df)} records")
-                    
+                    df = future.result()
                 except Exception as e:
-                    logger.error(f"  ✗ Variable {var_id}: {e}")
+                    logger.error(f"  ✗ [{done}/{total}] {station_code}: {e}")
                     continue
-            
-            # Create DataFrame for this station
-            if 'tiempo' in station_data:
-                df_station = pd.DataFrame({
-                    'tiempo': station_data['tiempo']
-                })
                 
-                for key, value in station_data.items():
-                    if key != 'tiempo':
-                        if isinstance(value, (list, pd.Series)):
-                            df_station[key] = value
-                        else:
-                            df_station[key] = value
+                if df.empty:
+                    logger.warning(f"  [{done}/{total}] No data for {station_code}")
+                    continue
                 
-                all_data.append(df_station)
+                results[station_code] = df
+                logger.info(f"  ✓ [{done}/{total}] {station_code}: {len(df)} records")
+        
+        # Add station metadata after 'tiempo'
+        all_data = []
+        
+        station_rows = stations_to_use[
+            ['codigo', 'nombre', 'region', 'latitud', 'longitud', 'elevacion']
+        ].itertuples(index=False, name='Station')
+        
+        for station_row in station_rows:
+            df = results.get(station_row.codigo)
+            if df is None:
+                continue
+            
+            station_data = {
+                'estacion_codigo': station_row.codigo,
+                'estacion_nombre': station_row.nombre,
+                'region': station_row.region,
+                'latitud': station_row.latitud,
+                'longitud': station_row.longitud,
+                'elevacion': station_row.elevacion
+            }
+            
+            value_cols = [col for col in df.columns if col != 'tiempo']
+            df_station = df.assign(**station_data)[['tiempo', *station_data, *value_cols]]
+            all_data.append(df_station)
         
         # Consolidate all stations
         if not all_data:
             logger.error("No data downloaded")
             return pd.DataFrame()
         
+        # Each chunk is already ordered by 'tiempo', so ordering the chunks by
+        # station code yields a globally sorted frame without a full sort
+        all_data.sort(key=lambda d: d['estacion_codigo'].iat[0])
         df_final = pd.concat(all_data, ignore_index=True)
-        df_final = df_final.sort_values(['estacion_codigo', 'tiempo'])
-        df_final = df_final.reset_index(drop=True)
         
         logger.info(f"Download complete: {len(df_final)} total records")
         return df_final
     
+    def _fetch_station(
+        self,
+        station_code: str,
+        var_ids: List[int],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        agg_rule: Optional[str]
+    ) -> pd.DataFrame:
+        """Download all variables for one station (runs in a worker thread)."""
+        # Use client's built-in aggregation
+        return self.client.get_data_multi(
+            station=station_code,
+            variables=var_ids,
+            start_date=start_date,
+            end_date=end_date,
+            aggregation=agg_rule,
+            max_workers=1
+        )
+    
     def _aggregate_daily(self, df: pd.DataFrame, var_id: int) -> pd.DataFrame:
         """Aggregate data to daily based on variable type."""
         if df.empty:
             return df
         
-        df = df.copy()
-        df.set_index('tiempo', inplace=True)
+        daily = df.set_index('tiempo').resample('D')
         
         # Temperature: compute min/max/mean
-        if var_id == 2002:  # Temperature
-            df_daily = df.resample('D').agg({
-                'valor': ['mean', 'min', 'max']
-            })
-            df_daily.columns = ['tmedia', 'tmin', 'tmax']
+        if var_id == VAR_TEMPERATURA_MEDIA:
+            df_daily = daily.agg(
+                tmedia=('valor', 'mean'),
+                tmin=('valor', 'min'),
+                tmax=('valor', 'max')
+            )
         
         # Precipitation: sum
-        elif var_id == 2001:  # Precipitation
-            df_daily = df.resample('D').sum()
-            df_daily.columns = ['pp_acum']
+        elif var_id == VAR_PRECIPITACION:
+            df_daily = daily.agg(pp_acum=('valor', 'sum'))
         
         # Others: mean
         else:
-            df_daily = df.resample('D').mean()
-            df_daily.columns = [f'var_{var_id}']
+            df_daily = daily.agg(**{f'var_{var_id}': ('valor', 'mean')})
         
         df_daily = df_daily.reset_index()
         return df_daily
@@ -245,23 +274,52 @@ class RegionalDownloader:
     def save_to_csv(
         self,
         df: pd.DataFrame,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        format: str = 'csv',
+        compression: Optional[str] = None
     ) -> str:
         """
-        Save DataFrame to CSV file.
+        Save DataFrame to CSV (or Parquet) file.
         
         Args:
             df: DataFrame to save
             filename: Output filename (auto-generated if None)
+            format: 'csv' or 'parquet'. Parquet (requires pyarrow) is much
+                    faster to write and several times smaller on disk.
+            compression: CSV compression (e.g., 'gzip'); Parquet files are
+                         always written with zstd
             
         Returns:
             Path to saved file
+        
+        Raises:
+            ValueError: If format is not 'csv' or 'parquet'
+        
+        Example:
+            >>> downloader.save_to_csv(df, format='parquet')
+            'clima_r16.parquet'
         """
+        if format not in ('csv', 'parquet'):
+            raise ValueError(f"Unknown format: {format}. Use 'csv' or 'parquet'")
+        
         if filename is None:
             region_code = self.region if self.region.startswith('R') else 'region'
-            filename = f"clima_{region_code.lower()}.csv"
+            filename = f"clima_{region_code.lower()}.{format}"
+        
+        if format == 'parquet':
+            # Repeated station codes/regions are stored once per row group as dictionaries
+            categorical = [col for col in ('estacion_codigo', 'estacion_nombre', 'region') if col in df]
+            df_out = df.astype({col: 'category' for col in categorical})
+            df_out.to_parquet(
+                filename,
+                index=False,
+                engine='pyarrow',
+                compression='zstd',
+                row_group_size=1_000_000
+            )
+        else:
+            df.to_csv(filename, index=False, compression=compression)
         
-        df.to_csv(filename, index=False)
         logger.info(f"Saved to {filename} ({len(df)} records)")
         
         return filename
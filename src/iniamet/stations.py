@@ -5,16 +5,45 @@ Handles station queries, filtering, and variable validation.
 """
 
 import logging
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, FrozenSet
+import numpy as np
 import pandas as pd
 
 from .api_client import APIClient
 from .cache import CacheManager
-from .utils import normalize_text, REGION_MAP
+from .utils import normalize_text, normalize_texts, REGION_MAP
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_station_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the low-cardinality station columns as categoricals.
+    
+    'tipo' is upper-cased first so type filters are plain equality checks.
+    """
+    if 'tipo' in df.columns:
+        df['tipo'] = df['tipo'].astype(str).str.upper().astype('category')
+    if 'region' in df.columns:
+        df['region'] = df['region'].astype('category')
+    return df
+
+
+def _equals_mask(column: pd.Series, value: str) -> np.ndarray:
+    """
+    Boolean mask of ``column == value``.
+    
+    For categoricals the value is looked up once among the categories and
+    the integer codes are compared, instead of comparing every row.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if value not in categories:
+            return np.zeros(len(column), dtype=bool)
+        return column.cat.codes.to_numpy() == categories.get_loc(value)
+    return (column == value).to_numpy()
+
+
 class StationManager:
     """Manages station catalog and queries."""
     
@@ -28,7 +57,12 @@ class StationManager:
         """
         self.api = api
         self.cache = cache
+        # Shared by reference and never mutated: _filter_stations always
+        # returns a new frame
         self._stations_cache: Optional[pd.DataFrame] = None
+        # Station code -> row position in _stations_cache, built on demand
+        self._code_index: Optional[Dict[str, int]] = None
+        self._var_id_sets: Dict[str, FrozenSet[int]] = {}
     
     def get_stations(
         self,
@@ -51,14 +85,15 @@ class StationManager:
         # Check memory cache
         if self._stations_cache is not None and not force_update:
             logger.info("Using cached stations from memory")
-            df = self._stations_cache.copy()
+            df = self._stations_cache
         else:
             # Try disk cache
             if self.cache and not force_update:
                 df = self.cache.get_stations()
                 if df is not None:
                     logger.info("Using cached stations from disk")
-                    self._stations_cache = df.copy()
+                    df = _normalize_station_dtypes(df)
+                    self._set_stations_cache(df)
                     return self._filter_stations(df, region, station_type)
             
             # Fetch from API
@@ -68,36 +103,74 @@ class StationManager:
             if not data:
                 return pd.DataFrame()
             
-            # Normalize station data
-            stations = []
+            # Normalize station data column by column
+            stations = {
+                'codigo': [], 'nombre': [], 'region': [], 'comuna': [],
+                'latitud': [], 'longitud': [], 'elevacion': [], 'tipo': [],
+                'primera_lectura': []
+            }
             for item in data:
-                # Extract station type from code (e.g., "INIA" from "INIA-47")
-                codigo = item.get('identificador', '')
-                tipo = codigo.split('-')[0] if '-' in codigo else 'OTHER'
-                
-                stations.append({
-                    'codigo': codigo,
-                    'nombre': item.get('nombre', ''),
-                    'region': item.get('region', ''),
-                    'comuna': item.get('comuna', ''),
-                    'latitud': item.get('latitud'),
-                    'longitud': item.get('longitud'),
-                    'elevacion': item.get('elevacion'),
-                    'tipo': tipo,
-                    'primera_lectura': item.get('primer_dato', '')
-                })
+                stations['codigo'].append(item.get('identificador', ''))
+                stations['nombre'].append(item.get('nombre', ''))
+                stations['region'].append(item.get('region', ''))
+                stations['comuna'].append(item.get('comuna', ''))
+                stations['latitud'].append(item.get('latitud'))
+                stations['longitud'].append(item.get('longitud'))
+                stations['elevacion'].append(item.get('elevacion'))
+                stations['primera_lectura'].append(item.get('primer_dato', ''))
+            
+            # Extract station type from code (e.g., "INIA" from "INIA-47")
+            stations['tipo'] = [
+                prefix if sep else 'OTHER'
+                for prefix, sep, _ in (codigo.partition('-') for codigo in stations['codigo'])
+            ]
             
-            df = pd.DataFrame(stations)
+            df = _normalize_station_dtypes(pd.DataFrame(stations))
             
             # Save to caches
             if self.cache:
                 self.cache.save_stations(df)
-            self._stations_cache = df.copy()
+            self._set_stations_cache(df)
             
             logger.info(f"Retrieved {len(df)} stations")
         
         return self._filter_stations(df, region, station_type)
     
+    def get_station(self, code: str) -> Optional[pd.Series]:
+        """
+        Get a single station by its code.
+        
+        Args:
+            code: Station code (e.g., "INIA-47")
+        
+        Returns:
+            Series with the station's columns, or None if the code is unknown
+        
+        Example:
+            >>> manager.get_station("INIA-47")['nombre']
+            'Chillán'
+        """
+        if self._stations_cache is None:
+            self.get_stations()
+        df = self._stations_cache
+        if df is None or df.empty:
+            return None
+        
+        if self._code_index is None:
+            # First row wins if a code appears twice
+            index: Dict[str, int] = {}
+            for i, c in enumerate(df['codigo'].tolist()):
+                index.setdefault(c, i)
+            self._code_index = index
+        
+        idx = self._code_index.get(code)
+        return None if idx is None else df.iloc[idx]
+    
+    def _set_stations_cache(self, df: pd.DataFrame):
+        """Replace the in-memory station table and drop its code index."""
+        self._stations_cache = df
+        self._code_index = None
+    
     def _filter_stations(
         self,
         df: pd.DataFrame,
@@ -106,31 +179,29 @@ class StationManager:
     ) -> pd.DataFrame:
         """Apply filters to station DataFrame."""
         if df.empty:
-            return df
+            return df.copy()
         
-        result = df.copy()
+        # Boolean masks and reset_index build new frames, so the cached
+        # table is never handed out or modified
+        result = df
         
         # Filter by region
         if region:
             # Convert region code to name if needed
-            if region.upper().startswith('R'):
-                region_name = REGION_MAP.get(region.upper())
-                if region_name:
-                    result = result[result['region'] == region_name]
-                else:
-                    logger.warning(f"Unknown region code: {region}")
-                    return pd.DataFrame()
+            region_up = region.upper()
+            if region_up in REGION_MAP:
+                result = result[_equals_mask(result['region'], REGION_MAP[region_up])]
             else:
                 # Direct region name match
                 result = result[
                     result['region'].str.lower() == region.lower()
                 ]
+                if result.empty:
+                    logger.warning(f"Unknown region: {region}")
         
         # Filter by station type
         if station_type:
-            result = result[
-                result['tipo'].str.upper() == station_type.upper()
-            ]
+            result = result[_equals_mask(result['tipo'], station_type.upper())]
         
         logger.info(f"Filtered to {len(result)} stations")
         return result.reset_index(drop=True)
@@ -148,8 +219,12 @@ class StationManager:
             force_update: Force refresh from API
             
         Returns:
-            DataFrame with columns: variable_id, nombre, unidad
+            DataFrame with columns: variable_id, nombre, unidad, nombre_norm
+            (lower-cased, accent-free name used for name lookups)
         """
+        if force_update:
+            self._var_id_sets.pop(station, None)
+        
         # Check cache
         if self.cache and not force_update:
             df = self.cache.get_variables(station)
@@ -169,11 +244,12 @@ class StationManager:
         for item in data:
             variables.append({
                 'variable_id': item.get('identificador'),
-                'nombre': item.get('nombre', ''),
-                'unidad': item.get('unidad', '')
+                'nombre': item.get('nombre') or '',
+                'unidad': item.get('unidad') or ''
             })
         
         df = pd.DataFrame(variables)
+        df['nombre_norm'] = normalize_texts(df['nombre'])
         
         # Save to cache
         if self.cache:
@@ -197,23 +273,29 @@ class StationManager:
         Returns:
             True if variable exists, False otherwise
         """
+        # Check by ID
+        if isinstance(variable, int) or variable.isdigit():
+            return int(variable) in self._get_variable_id_set(station)
+        
         df_vars = self.get_variables(station)
         
         if df_vars.empty:
             return False
         
-        # Check by ID
-        if isinstance(variable, int) or variable.isdigit():
-            var_id = int(variable)
-            return var_id in df_vars['variable_id'].values
-        
         # Check by name (fuzzy match)
         variable_lower = normalize_text(str(variable))
-        for nombre in df_vars['nombre']:
-            if variable_lower in normalize_text(nombre):
-                return True
-        
-        return False
+        return bool(self._match_variable_names(df_vars, variable_lower).any())
+    
+    def _get_variable_id_set(self, station: str) -> FrozenSet[int]:
+        """Variable IDs available at a station, memoized per station."""
+        ids = self._var_id_sets.get(station)
+        if ids is None:
+            df_vars = self.get_variables(station)
+            if df_vars.empty:
+                return frozenset()
+            ids = frozenset(int(v) for v in df_vars['variable_id'].dropna())
+            self._var_id_sets[station] = ids
+        return ids
     
     def find_variable_id(
         self,
@@ -236,9 +318,16 @@ class StationManager:
             return None
         
         variable_lower = normalize_text(variable_name)
+        hits = df_vars['variable_id'][self._match_variable_names(df_vars, variable_lower)]
         
-        for _, row in df_vars.iterrows():
-            if variable_lower in normalize_text(row['nombre']):
-                return int(row['variable_id'])
-        
-        return None
+        return int(hits.iloc[0]) if len(hits) else None
+    
+    @staticmethod
+    def _match_variable_names(df_vars: pd.DataFrame, variable_lower: str) -> pd.Series:
+        """Boolean mask of variables whose normalized name contains variable_lower."""
+        if 'nombre_norm' in df_vars.columns:
+            normalized = df_vars['nombre_norm']
+        else:
+            # Variables cached by older versions lack the normalized column
+            normalized = pd.Series(normalize_texts(df_vars['nombre']), index=df_vars.index)
+        return normalized.str.contains(variable_lower, regex=False, na=False)
@@ -2,12 +2,15 @@
 Utility functions for the INIAMET library.
 """
 
+import datetime as _dt
 from datetime import datetime, date
-from typing import Union, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union, Optional, Iterable, List, Dict, Final
 
 
-# Region code mapping
-REGION_MAP = {
+# Region code mapping (read-only: the lookup indexes below are derived from it)
+REGION_MAP = MappingProxyType({
     "R01": "Tarapacá",
     "R02": "Antofagasta",
     "R03": "Atacama",
@@ -24,7 +27,7 @@ REGION_MAP = {
     "R14": "Los Ríos",
     "R15": "Arica y Parinacota",
     "R16": "Ñuble"
-}
+})
 
 # ============================================================================
 # VARIABLE ID CONSTANTS - Use these constants instead of magic numbers
@@ -127,6 +130,10 @@ VARIABLE_INFO = {
 }
 
 
+# Known variable IDs, for fast membership checks and set operations
+VALID_VARIABLE_IDS = frozenset(VARIABLE_INFO)
+
+
 def get_variable_info(variable_id: int) -> dict:
     """
     Get metadata for a variable ID.
@@ -159,6 +166,28 @@ def get_variable_info(variable_id: int) -> dict:
     return VARIABLE_INFO[variable_id]
 
 
+def get_variable_infos(variable_ids: Iterable[int]) -> List[dict]:
+    """
+    Get metadata for several variable IDs at once.
+    
+    Args:
+        variable_ids: Variable IDs from INIA API
+    
+    Returns:
+        List of metadata dictionaries (see ``get_variable_info``), in input order
+    
+    Example:
+        >>> from iniamet.utils import get_variable_infos
+        >>> [info['unidad'] for info in get_variable_infos([2002, 2001])]
+        ['°C', 'mm']
+    """
+    known = VARIABLE_INFO
+    return [
+        known[var_id] if var_id in known else get_variable_info(var_id)
+        for var_id in variable_ids
+    ]
+
+
 def is_valid_variable_id(variable_id: int) -> bool:
     """
     Check if a variable ID is valid/known.
@@ -176,7 +205,7 @@ def is_valid_variable_id(variable_id: int) -> bool:
         >>> is_valid_variable_id(9999)
         False
     """
-    return variable_id in VARIABLE_INFO
+    return variable_id in VALID_VARIABLE_IDS
 
 
 def list_all_variables() -> 'pd.DataFrame':
@@ -190,6 +219,13 @@ def list_all_variables() -> 'pd.DataFrame':
         >>> from iniamet.utils import list_all_variables
         >>> vars_df = list_all_variables()\n        >>> print(vars_df[['variable_id', 'nombre', 'unidad']])
     """
+    # Copy so callers can't mutate the cached table
+    return _list_all_variables_cached().copy()
+
+
+@lru_cache(maxsize=1)
+def _list_all_variables_cached() -> 'pd.DataFrame':
+    """Build the variable table once; VARIABLE_INFO never changes at runtime."""
     import pandas as pd
     
     data = []
@@ -224,18 +260,22 @@ def get_variable_id_by_name(name: str) -> Optional[int]:
     name_normalized = normalize_text(name)
     
     # Try exact match first
-    for var_id, info in VARIABLE_INFO.items():
-        if normalize_text(info['nombre']) == name_normalized:
-            return var_id
+    var_id = _NORM_VARIABLE_NAME_TO_ID.get(name_normalized)
+    if var_id is not None:
+        return var_id
     
     # Try partial match
-    for var_id, info in VARIABLE_INFO.items():
-        if name_normalized in normalize_text(info['nombre']):
+    for var_id, var_name in _NORM_VARIABLE_NAMES:
+        if name_normalized in var_name:
             return var_id
     
     return None
 
 
+# Spanish accents removed by normalize_text (single translate pass)
+_ACCENT_TABLE = str.maketrans('áéíóúñü', 'aeiounu')
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for comparison (lowercase + remove accents).
@@ -250,18 +290,118 @@ def normalize_text(text: str) -> str:
         >>> normalize_text("Precipitación")
         'precipitacion'
     """
-    text = text.lower()
+    return text.lower().translate(_ACCENT_TABLE)
+
+
+# Batches at least this large are normalized by the numba kernel (if installed)
+NUMBA_NORMALIZE_MIN_SIZE = 1000
+
+
+def normalize_texts(texts: Iterable[str]) -> List[str]:
+    """
+    Normalize many strings at once (see ``normalize_text``).
     
-    # Remove Spanish accents
-    replacements = {
-        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-        'ñ': 'n', 'ü': 'u'
-    }
+    Large batches are processed by a numba-compiled byte kernel when numba
+    is installed (pip install iniamet[fast]); results are identical to
+    calling ``normalize_text`` on each string.
+    
+    Args:
+        texts: Iterable of strings (e.g., a pandas Series of names)
     
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    Returns:
+        List of normalized strings, in input order
+    
+    Example:
+        >>> normalize_texts(["Precipitación", "Ñuble"])
+        ['precipitacion', 'nuble']
+    """
+    texts = list(texts)
+    if len(texts) < NUMBA_NORMALIZE_MIN_SIZE:
+        return [normalize_text(text) for text in texts]
+    
+    kernel = _get_normalize_kernel()
+    if kernel is None:
+        return [normalize_text(text) for text in texts]
+    
+    import numpy as np
+    
+    encoded = [text.encode('utf-8') for text in texts]
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    buffer = np.frombuffer(b''.join(encoded), dtype=np.uint8)
     
-    return text
+    out, out_lengths, fallback = kernel(buffer, offsets)
+    out_bytes = out.tobytes()
+    
+    result = []
+    for i, text in enumerate(texts):
+        if fallback[i]:
+            # Non-ASCII characters outside the accent table
+            result.append(normalize_text(text))
+        else:
+            start = offsets[i]
+            result.append(out_bytes[start:start + out_lengths[i]].decode('utf-8'))
+    return result
+
+
+@lru_cache(maxsize=1)
+def _get_normalize_kernel():
+    """Compile the batch normalization kernel on first use; None without numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    import numpy as np
+    
+    # Second byte of the UTF-8 sequences 0xC3 0x?? handled by the kernel
+    # (upper and lower case á é í ó ú ñ ü) mapped to their ASCII letter
+    accent_map = np.zeros(256, dtype=np.uint8)
+    for char, ascii_char in zip('áéíóúñüÁÉÍÓÚÑÜ', 'aeiounuaeiounu'):
+        accent_map[char.encode('utf-8')[1]] = ord(ascii_char)
+    
+    @njit(cache=True)
+    def kernel(buffer, offsets):
+        n = offsets.shape[0] - 1
+        out = np.empty_like(buffer)
+        out_lengths = np.zeros(n, dtype=np.int64)
+        fallback = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            j = offsets[i]
+            end = offsets[i + 1]
+            k = offsets[i]
+            while j < end:
+                b = buffer[j]
+                if b < 128:
+                    # ASCII: lower-case A-Z
+                    out[k] = b + 32 if 65 <= b <= 90 else b
+                    j += 1
+                elif b == 0xC3 and j + 1 < end and accent_map[buffer[j + 1]] != 0:
+                    out[k] = accent_map[buffer[j + 1]]
+                    j += 2
+                else:
+                    fallback[i] = True
+                    break
+                k += 1
+            out_lengths[i] = k - offsets[i]
+        return out, out_lengths, fallback
+    
+    return kernel
+
+
+# Reverse indexes for O(1) region lookups
+_NORM_NAME_TO_CODE: Final[Dict[str, str]] = {
+    normalize_text(name): code for code, name in REGION_MAP.items()
+}
+_UPPER_NAME_TO_NAME: Final[Dict[str, str]] = {name.upper(): name for name in REGION_MAP.values()}
+
+# Normalized variable names, in VARIABLE_INFO order (first match wins)
+_NORM_VARIABLE_NAMES: Final = tuple(
+    (var_id, normalize_text(info['nombre'])) for var_id, info in VARIABLE_INFO.items()
+)
+_NORM_VARIABLE_NAME_TO_ID: Final[Dict[str, int]] = {
+    var_name: var_id for var_id, var_name in reversed(_NORM_VARIABLE_NAMES)
+}
 
 
 def parse_date(date: Union[str, datetime, date]) -> datetime:
@@ -277,22 +417,36 @@ def parse_date(date: Union[str, datetime, date]) -> datetime:
     Raises:
         ValueError: If date format is invalid
     """
-    # Handle different input types
+    # Handle different input types (the ``date`` argument shadows the
+    # datetime.date class here, hence _dt.date)
     if isinstance(date, str):
-        try:
-            return datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
-            raise ValueError(
-                f"Invalid date format: {date}. Expected YYYY-MM-DD"
-            )
+        return _parse_date_str(date)
     elif isinstance(date, datetime):
         return date
-    elif isinstance(date, date):
+    elif isinstance(date, _dt.date):
         return datetime.combine(date, datetime.min.time())
     else:
         raise TypeError(f"Expected str, datetime, or date, got {type(date)}")
 
 
+@lru_cache(maxsize=256)
+def _parse_date_str(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string; memoized since callers repeat date ranges."""
+    # fromisoformat is a C fast path for the canonical form; strptime keeps
+    # accepting non-padded dates such as "2024-9-1"
+    if len(value) == 10 and value[4] == value[7] == '-':
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(
+            f"Invalid date format: {value}. Expected YYYY-MM-DD"
+        )
+
+
 def format_station_code(code: str) -> str:
     """
     Normalize station code format.
@@ -325,10 +479,9 @@ def get_region_name(code: str) -> str:
     if code in REGION_MAP:
         return REGION_MAP[code]
 
-    # If it's a region name, find the corresponding code
-    for region_code, region_name in REGION_MAP.items():
-        if region_name.upper() == code:
-            return region_name
+    # If it's a region name, return its canonical spelling
+    if code in _UPPER_NAME_TO_NAME:
+        return _UPPER_NAME_TO_NAME[code]
 
     # Try to find partial matches (e.g., "COQUIMBO" should match "Coquimbo")
     for region_code, region_name in REGION_MAP.items():
@@ -350,13 +503,8 @@ def get_region_code(name: str) -> Optional[str]:
         Region code (e.g., "R16") or None if invalid
     """
     # If already a code, return it
-    if name.upper() in REGION_MAP:
-        return name.upper()
-    
-    name_normalized = normalize_text(name)
-    
-    for code, region_name in REGION_MAP.items():
-        if normalize_text(region_name) == name_normalized:
-            return code
+    code = name.upper()
+    if code in REGION_MAP:
+        return code
     
-    return None
+    return _NORM_NAME_TO_CODE.get(normalize_text(name))
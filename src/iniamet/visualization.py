@@ -4,16 +4,224 @@ Visualization module for INIA meteorological data.
 High-level functions to create interactive maps and plots.
 """
 
+import gzip
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from string import Formatter
 from typing import Optional, Union, List
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import folium
 from folium.plugins import HeatMap
-from IPython.display import IFrame, display
+from branca.element import Element, MacroElement
+from jinja2 import Template
+
+from .api_client import paced_requests
+from .qc import apply_quality_control
 
 logger = logging.getLogger(__name__)
 
+# Temperature color scale: _TEMP_COLORS[i] covers [_TEMP_THRESHOLDS[i-1], _TEMP_THRESHOLDS[i])
+_TEMP_THRESHOLDS = np.array([10, 15, 20, 25, 30], dtype=float)
+_TEMP_COLORS = np.array(['blue', 'lightblue', 'green', 'orange', 'red', 'darkred'])
+
+# Whether one folium.Icon can be attached to many markers
+_CAN_SHARE_ICONS = hasattr(folium.Marker, 'SetIcon')
+
+# QC used for temperature maps
+_qc_temperature = partial(apply_quality_control, variable_name='temperatura')
+
+# Marker popups, filled for all stations at once by _format_columns
+_TEMP_POPUP_TEMPLATE = """
+        <div style="font-family: Arial; width: 200px;">
+            <h4 style="margin: 0; color: #2c3e50;">{codigo}</h4>
+            <p style="margin: 3px 0;"><b>{nombre}</b></p>
+            <hr style="margin: 5px 0;">
+            <p style="margin: 3px 0;">🌡️ <b>Tmax:</b> {tmax:.1f}°C</p>
+            <p style="margin: 3px 0;">📅 <b>Fecha:</b> {date}</p>
+            <p style="margin: 3px 0; font-size: 10px;">
+                📍 {lat:.5f}, {lon:.5f}
+            </p>
+        </div>
+        """
+
+_STATION_POPUP_TEMPLATE = """
+        <div style="font-family: Arial; width: 200px;">
+            <h4 style="margin: 0;">{codigo}</h4>
+            <p style="margin: 3px 0;"><b>{nombre}</b></p>
+            <hr style="margin: 5px 0;">
+            <p style="margin: 3px 0;">🏛️ {tipo}</p>
+            <p style="margin: 3px 0;">📍 {region}</p>
+            <p style="margin: 3px 0; font-size: 10px;">
+                {lat:.5f}, {lon:.5f}
+            </p>
+        </div>
+        """
+
+# Map overlays (title is filled with str.format per map)
+_TITLE_TEMPLATE = '''
+    <div style="position: fixed; 
+                top: 10px; left: 50px; 
+                width: 350px; height: 70px; 
+                background-color: white; 
+                border: 2px solid grey; 
+                z-index: 9999; 
+                padding: 10px;
+                border-radius: 5px;
+                box-shadow: 2px 2px 6px rgba(0,0,0,0.3);">
+        <h3 style="margin: 0;">🗺️ Temperaturas Máximas</h3>
+        <p style="margin: 5px 0; font-size: 12px;">
+            📅 {date} | 📊 {n_stations} estaciones
+        </p>
+    </div>
+    '''
+
+_LEGEND_HTML = '''
+    <div style="position: fixed; 
+                bottom: 50px; left: 50px; 
+                width: 180px; 
+                background-color: white; 
+                border: 2px solid grey; 
+                z-index: 9999; 
+                padding: 10px;
+                border-radius: 5px;
+                box-shadow: 2px 2px 6px rgba(0,0,0,0.3);">
+        <h4 style="margin: 0 0 10px 0;">🌡️ Temperatura (°C)</h4>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: blue; margin-right: 10px; border-radius: 3px;"></div>
+            <span>&lt; 10°C</span>
+        </div>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: lightblue; margin-right: 10px; border-radius: 3px;"></div>
+            <span>10-15°C</span>
+        </div>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: green; margin-right: 10px; border-radius: 3px;"></div>
+            <span>15-20°C</span>
+        </div>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: orange; margin-right: 10px; border-radius: 3px;"></div>
+            <span>20-25°C</span>
+        </div>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: red; margin-right: 10px; border-radius: 3px;"></div>
+            <span>25-30°C</span>
+        </div>
+        <div style="display: flex; align-items: center; margin: 5px 0;">
+            <div style="width: 20px; height: 20px; background: darkred; margin-right: 10px; border-radius: 3px;"></div>
+            <span>&gt; 30°C</span>
+        </div>
+    </div>
+    '''
+
+
+class _RawHTML(Element):
+    """HTML inserted verbatim: no Jinja compilation at creation or on render."""
+    
+    def __init__(self, html: str):
+        super().__init__()
+        self._html = html
+    
+    def render(self, **kwargs) -> str:
+        return self._html
+
+
+def _clean_coords(df: pd.DataFrame, extra: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Coerce latitud/longitud to numbers and drop rows missing them.
+    
+    Columns that are already numeric skip the conversion. Rows missing any
+    of the extra columns are dropped as well.
+    """
+    cols = ['latitud', 'longitud']
+    if not all(df[c].dtype.kind in 'fi' for c in cols):
+        df = df.assign(**{c: pd.to_numeric(df[c], errors='coerce') for c in cols})
+    return df.dropna(subset=cols + (extra or []))
+
+
+def _format_columns(template: str, n: int, **columns) -> List[str]:
+    """
+    Fill a str.format template for n rows at once.
+    
+    Each field is an array of n values (formatted with numpy when the field
+    has a spec such as ``.1f``) or a single string shared by all rows.
+    """
+    out = np.full(n, '', dtype=object)
+    for literal, field, spec, _ in Formatter().parse(template):
+        if literal:
+            out = out + literal
+        if field is None:
+            continue
+        values = columns[field]
+        if isinstance(values, str):
+            out = out + values
+            continue
+        if spec:
+            values = np.char.mod(f'%{spec}', np.asarray(values, dtype=float))
+        out = out + np.asarray(values, dtype=str).astype(object)
+    return out.tolist()
+
+
+def _save_map(mapa: folium.Map, output_file: str, compress: bool = False) -> str:
+    """Save a map as HTML, optionally gzip-compressed; returns the written path."""
+    if not compress:
+        mapa.save(output_file)
+        return output_file
+    
+    if not output_file.endswith('.gz'):
+        output_file += '.gz'
+    with gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=6) as f:
+        f.write(mapa.get_root().render())
+    return output_file
+
+
+class _CircleMarkerLayer(MacroElement):
+    """
+    Many circle markers rendered as one Leaflet featureGroup.
+    
+    Markers are emitted as a single JSON array mapped to L.circleMarker in
+    the browser, instead of one folium element (and Jinja render) each.
+    HTML-significant characters are escaped so popups can't close the
+    surrounding <script> tag.
+    
+    Args:
+        markers: List of [lat, lon, color, popup_html]
+        radius: Marker radius in pixels
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.featureGroup(
+                {{ this.markers_json }}.map(function (m) {
+                    return L.circleMarker([m[0], m[1]], {
+                        radius: {{ this.radius }},
+                        color: m[2],
+                        fill: true,
+                        fillColor: m[2],
+                        fillOpacity: 0.7,
+                        weight: 2
+                    }).bindPopup(m[3], {maxWidth: 300});
+                })
+            ).addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+    """)
+    
+    def __init__(self, markers: List[list], radius: int = 4):
+        super().__init__()
+        self._name = 'CircleMarkerLayer'
+        self.markers_json = (
+            json.dumps(markers, ensure_ascii=False)
+            .replace('&', '\\u0026')
+            .replace('<', '\\u003c')
+            .replace('>', '\\u003e')
+            .replace('\u2028', '\\u2028')
+            .replace('\u2029', '\\u2029')
+        )
+        self.radius = radius
+
 
 def plot_temperature_map(
     stations_df: pd.DataFrame,
@@ -24,7 +232,8 @@ def plot_temperature_map(
     heatmap_radius: int = 50,
     heatmap_blur: int = 35,
     zoom_start: int = 10,
-    show_inline: bool = True
+    show_inline: bool = True,
+    compress: bool = False
 ) -> folium.Map:
     """
     Create an interactive temperature map with one line of code.
@@ -39,6 +248,8 @@ def plot_temperature_map(
         heatmap_blur: Blur amount for heatmap (larger = smoother)
         zoom_start: Initial zoom level
         show_inline: Display map inline in Jupyter notebook
+        compress: Write gzip-compressed HTML (".gz" is appended to
+                  output_file if missing)
         
     Returns:
         Folium Map object
@@ -51,75 +262,70 @@ def plot_temperature_map(
         ...     date='2025-10-12'
         ... )
     """
-    # Merge station info with temperature data
-    df = stations_df.merge(
-        temperature_data[['codigo', 'tmax']], 
-        on='codigo', 
+    # Stop before any coordinate work if no station has temperature data
+    has_data = np.isin(stations_df['codigo'].to_numpy(), temperature_data['codigo'].to_numpy())
+    if not has_data.any():
+        logger.error("No valid data to plot")
+        return None
+    
+    # Join station info with temperature data on the station code index
+    # (reusing it if the caller already indexed stations by codigo)
+    stations = stations_df[has_data]
+    if stations.index.name == 'codigo':
+        stations = stations.drop(columns='codigo', errors='ignore')
+    else:
+        stations = stations.set_index('codigo')
+    df = stations.join(
+        temperature_data.set_index('codigo')[['tmax']],
         how='inner'
-    )
+    ).reset_index()
     
     # Ensure numeric coordinates
-    df['latitud'] = pd.to_numeric(df['latitud'], errors='coerce')
-    df['longitud'] = pd.to_numeric(df['longitud'], errors='coerce')
-    df = df.dropna(subset=['latitud', 'longitud', 'tmax'])
+    df = _clean_coords(df, extra=['tmax'])
     
     if len(df) == 0:
         logger.error("No valid data to plot")
         return None
     
+    # Coordinates as plain arrays, reused for the center and the markers
+    lat_values = df['latitud'].to_numpy(dtype=float)
+    lon_values = df['longitud'].to_numpy(dtype=float)
+    
     # Calculate map center
-    center_lat = df['latitud'].mean()
-    center_lon = df['longitud'].mean()
+    center_lat = float(lat_values.mean())
+    center_lon = float(lon_values.mean())
     
     # Create base map
     mapa = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom_start,
-        tiles='OpenStreetMap'
+        tiles='OpenStreetMap',
+        prefer_canvas=True
     )
     
-    # Color scale function
-    def get_color(temp):
-        if temp < 10:
-            return 'blue'
-        elif temp < 15:
-            return 'lightblue'
-        elif temp < 20:
-            return 'green'
-        elif temp < 25:
-            return 'orange'
-        elif temp < 30:
-            return 'red'
-        else:
-            return 'darkred'
+    # Plain arrays for the marker loop (no per-row Series)
+    codes = df['codigo'].to_numpy()
+    names = df['nombre'].astype(object).fillna('').to_numpy() if 'nombre' in df.columns else [''] * len(df)
+    # 5 decimals (~1 m) is below map resolution and keeps the HTML small
+    lats = np.round(lat_values, 5)
+    lons = np.round(lon_values, 5)
+    tmaxs = df['tmax'].to_numpy(dtype=float)
+    
+    # Color scale for all stations in one binary search (10°C is 'lightblue')
+    colors = _TEMP_COLORS[np.searchsorted(_TEMP_THRESHOLDS, tmaxs, side='right')]
+    
+    # Popup HTML for all stations, assembled column-wise
+    popups = _format_columns(
+        _TEMP_POPUP_TEMPLATE, len(df),
+        codigo=codes, nombre=names, tmax=tmaxs, date=date, lat=lats, lon=lons
+    )
     
-    # Add markers
-    for _, row in df.iterrows():
-        color = get_color(row['tmax'])
-        
-        popup_html = f"""
-        <div style="font-family: Arial; width: 200px;">
-            <h4 style="margin: 0; color: #2c3e50;">{row['codigo']}</h4>
-            <p style="margin: 3px 0;"><b>{row.get('nombre', '')}</b></p>
-            <hr style="margin: 5px 0;">
-            <p style="margin: 3px 0;">🌡️ <b>Tmax:</b> {row['tmax']:.1f}°C</p>
-            <p style="margin: 3px 0;">📅 <b>Fecha:</b> {date}</p>
-            <p style="margin: 3px 0; font-size: 10px;">
-                📍 {row['latitud']:.6f}, {row['longitud']:.6f}
-            </p>
-        </div>
-        """
-        
-        folium.CircleMarker(
-            location=[row['latitud'], row['longitud']],
-            radius=marker_radius,
-            popup=folium.Popup(popup_html, max_width=300),
-            color=color,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.7,
-            weight=2
-        ).add_to(mapa)
+    # Add markers (one featureGroup for all stations)
+    markers = [
+        list(marker)
+        for marker in zip(lats.tolist(), lons.tolist(), colors.tolist(), popups)
+    ]
+    _CircleMarkerLayer(markers, radius=marker_radius).add_to(mapa)
     
     # Add heatmap (temporarily disabled due to folium bug)
     # TODO: Re-enable when folium issue is fixed
@@ -131,72 +337,20 @@ def plot_temperature_map(
     #     blur=int(heatmap_blur)
     # ).add_to(mapa)
     
-    # Add title
-    title_html = f'''
-    <div style="position: fixed; 
-                top: 10px; left: 50px; 
-                width: 350px; height: 70px; 
-                background-color: white; 
-                border: 2px solid grey; 
-                z-index: 9999; 
-                padding: 10px;
-                border-radius: 5px;
-                box-shadow: 2px 2px 6px rgba(0,0,0,0.3);">
-        <h3 style="margin: 0;">🗺️ Temperaturas Máximas</h3>
-        <p style="margin: 5px 0; font-size: 12px;">
-            📅 {date} | 📊 {len(df)} estaciones
-        </p>
-    </div>
-    '''
-    mapa.get_root().html.add_child(folium.Element(title_html))
-    
-    # Add legend
-    legend_html = '''
-    <div style="position: fixed; 
-                bottom: 50px; left: 50px; 
-                width: 180px; 
-                background-color: white; 
-                border: 2px solid grey; 
-                z-index: 9999; 
-                padding: 10px;
-                border-radius: 5px;
-                box-shadow: 2px 2px 6px rgba(0,0,0,0.3);">
-        <h4 style="margin: 0 0 10px 0;">🌡️ Temperatura (°C)</h4>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: blue; margin-right: 10px; border-radius: 3px;"></div>
-            <span>&lt; 10°C</span>
-        </div>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: lightblue; margin-right: 10px; border-radius: 3px;"></div>
-            <span>10-15°C</span>
-        </div>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: green; margin-right: 10px; border-radius: 3px;"></div>
-            <span>15-20°C</span>
-        </div>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: orange; margin-right: 10px; border-radius: 3px;"></div>
-            <span>20-25°C</span>
-        </div>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: red; margin-right: 10px; border-radius: 3px;"></div>
-            <span>25-30°C</span>
-        </div>
-        <div style="display: flex; align-items: center; margin: 5px 0;">
-            <div style="width: 20px; height: 20px; background: darkred; margin-right: 10px; border-radius: 3px;"></div>
-            <span>&gt; 30°C</span>
-        </div>
-    </div>
-    '''
-    mapa.get_root().html.add_child(folium.Element(legend_html))
+    # Add title and legend (static HTML, inserted without Jinja)
+    title_html = _TITLE_TEMPLATE.format(date=date, n_stations=len(df))
+    mapa.get_root().html.add_child(_RawHTML(title_html))
+    mapa.get_root().html.add_child(_RawHTML(_LEGEND_HTML))
     
     # Save map
-    mapa.save(output_file)
+    output_file = _save_map(mapa, output_file, compress)
     logger.info(f"✅ Map saved to {output_file}")
     
     # Display inline if requested
     if show_inline:
         try:
+            # Imported here so scripts that never display inline skip IPython
+            from IPython.display import IFrame, display
             display(IFrame(output_file, width=900, height=600))
         except Exception as e:
             logger.warning(f"Could not display inline: {e}")
@@ -208,7 +362,8 @@ def plot_station_map(
     stations_df: pd.DataFrame,
     output_file: str = 'stations_map.html',
     zoom_start: int = 6,
-    show_inline: bool = True
+    show_inline: bool = True,
+    compress: bool = False
 ) -> folium.Map:
     """
     Create a simple map showing all station locations.
@@ -218,6 +373,8 @@ def plot_station_map(
         output_file: Output HTML filename
         zoom_start: Initial zoom level
         show_inline: Display map inline in Jupyter notebook
+        compress: Write gzip-compressed HTML (".gz" is appended to
+                  output_file if missing)
         
     Returns:
         Folium Map object
@@ -226,55 +383,58 @@ def plot_station_map(
         >>> from iniamet.visualization import plot_station_map
         >>> mapa = plot_station_map(nuble_stations)
     """
-    # Clean data
-    df = stations_df.copy()
-    df['latitud'] = pd.to_numeric(df['latitud'], errors='coerce')
-    df['longitud'] = pd.to_numeric(df['longitud'], errors='coerce')
-    df = df.dropna(subset=['latitud', 'longitud'])
+    # Clean data (copy only the columns the markers use)
+    cols = ['codigo', 'nombre', 'tipo', 'region', 'latitud', 'longitud']
+    df = _clean_coords(stations_df[[c for c in cols if c in stations_df.columns]])
     
     if len(df) == 0:
         logger.error("No valid stations to plot")
         return None
     
     # Calculate center
-    center_lat = df['latitud'].mean()
-    center_lon = df['longitud'].mean()
+    center_lat = float(df['latitud'].to_numpy(dtype=float).mean())
+    center_lon = float(df['longitud'].to_numpy(dtype=float).mean())
     
     # Create map
     mapa = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom_start,
-        tiles='OpenStreetMap'
+        tiles='OpenStreetMap',
+        prefer_canvas=True
+    )
+    
+    # One icon for all markers when folium applies icons via Marker.SetIcon;
+    # older folium versions bind an icon to a single marker
+    shared_icon = folium.Icon(color='blue', icon='info-sign') if _CAN_SHARE_ICONS else None
+    
+    # Marker columns as arrays (missing text columns become empty strings)
+    codes, names, tipos, regiones = (
+        df[c].astype(object).fillna('').to_numpy() if c in df.columns else [''] * len(df)
+        for c in ('codigo', 'nombre', 'tipo', 'region')
+    )
+    lats = df['latitud'].to_numpy(dtype=float)
+    lons = df['longitud'].to_numpy(dtype=float)
+    popups = _format_columns(
+        _STATION_POPUP_TEMPLATE, len(df),
+        codigo=codes, nombre=names, tipo=tipos, region=regiones, lat=lats, lon=lons
     )
     
     # Add markers
-    for _, row in df.iterrows():
-        popup_html = f"""
-        <div style="font-family: Arial; width: 200px;">
-            <h4 style="margin: 0;">{row['codigo']}</h4>
-            <p style="margin: 3px 0;"><b>{row.get('nombre', '')}</b></p>
-            <hr style="margin: 5px 0;">
-            <p style="margin: 3px 0;">🏛️ {row.get('tipo', '')}</p>
-            <p style="margin: 3px 0;">📍 {row.get('region', '')}</p>
-            <p style="margin: 3px 0; font-size: 10px;">
-                {row['latitud']:.6f}, {row['longitud']:.6f}
-            </p>
-        </div>
-        """
-        
+    for i in range(len(df)):
         folium.Marker(
-            location=[row['latitud'], row['longitud']],
-            popup=folium.Popup(popup_html, max_width=300),
-            icon=folium.Icon(color='blue', icon='info-sign')
+            location=[round(lats[i], 5), round(lons[i], 5)],
+            popup=folium.Popup(popups[i], max_width=300),
+            icon=shared_icon or folium.Icon(color='blue', icon='info-sign')
         ).add_to(mapa)
     
     # Save
-    mapa.save(output_file)
+    output_file = _save_map(mapa, output_file, compress)
     logger.info(f"✅ Map saved to {output_file}")
     
     # Display inline
     if show_inline:
         try:
+            from IPython.display import IFrame, display
             display(IFrame(output_file, width=900, height=600))
         except Exception as e:
             logger.warning(f"Could not display inline: {e}")
@@ -289,6 +449,8 @@ def quick_temp_map(
     variable: int = 2002,
     output_file: str = 'temp_map.html',
     apply_qc: bool = True,
+    max_workers: int = 8,
+    rate_limit: float = None,
     **map_kwargs
 ):
     """
@@ -303,6 +465,10 @@ def quick_temp_map(
         variable: Variable ID (2002 = temperature)
         output_file: Output HTML filename
         apply_qc: Apply quality control filters
+        max_workers: Number of stations downloaded concurrently; requests
+            are paced through the client's rate limiter
+        rate_limit: Optional starting requests per second for the downloads;
+            defaults to the client's configured ``rate_limit``
         **map_kwargs: Additional arguments for plot_temperature_map
         
     Returns:
@@ -314,8 +480,6 @@ def quick_temp_map(
         >>> client = INIAClient()
         >>> mapa = quick_temp_map(client, region='Ñuble', date='2025-10-12')
     """
-    from .qc import apply_quality_control
-    
     # Default date to today
     if date is None:
         date = datetime.now().strftime('%Y-%m-%d')
@@ -324,46 +488,63 @@ def quick_temp_map(
     
     # Get stations
     stations = client.get_stations()
-    region_stations = stations[stations['region'] == region].copy()
-    region_stations = region_stations.dropna(subset=['latitud', 'longitud'])
+    region_stations = _clean_coords(stations[stations['region'] == region])
+    # Sorted codigo index: groupby output below is sorted by codigo too, so
+    # the join in plot_temperature_map aligns two monotonic indexes
+    region_stations = region_stations.sort_values('codigo').set_index('codigo', drop=False)
     
     logger.info(f"Found {len(region_stations)} stations in {region}")
     
-    # Download temperature data
-    temp_data = []
-    for _, station in region_stations.iterrows():
-        try:
-            df = client.get_data(
-                station=station['codigo'],
-                variable=variable,
-                start_date=date,
-                end_date=date
-            )
-            
-            if df is not None and not df.empty:
-                # Apply QC if requested
-                if apply_qc:
-                    df = apply_quality_control(df, 'temperatura')
-                
-                if not df.empty:
-                    tmax = df['valor'].max()
-                    if pd.notna(tmax):
-                        temp_data.append({
-                            'codigo': station['codigo'],
-                            'tmax': float(tmax)
-                        })
-        except Exception as e:
-            logger.debug(f"Error with {station['codigo']}: {e}")
-    
-    logger.info(f"Got temperature data for {len(temp_data)} stations")
-    
-    if not temp_data:
+    def fetch_values(codigo):
+        df = client.get_data(
+            station=codigo,
+            variable=variable,
+            start_date=date,
+            end_date=date
+        )
+        
+        if df is None or df.empty:
+            return None
+        
+        # Apply QC if requested
+        if apply_qc:
+            df = _qc_temperature(df)
+        
+        return df[['valor']].assign(codigo=codigo) if not df.empty else None
+    
+    # Download temperature data (one request per station, run concurrently)
+    frames = []
+    api = getattr(client, 'api', None)
+    with paced_requests(api, rate=rate_limit), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_values, codigo): codigo
+            for codigo in region_stations['codigo']
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+                if result is not None:
+                    frames.append(result)
+            except Exception as e:
+                logger.debug(f"Error with {futures[future]}: {e}")
+    
+    # Daily maximum per station in one groupby pass
+    if frames:
+        df_temp = (
+            pd.concat(frames, ignore_index=True)
+            .groupby('codigo', as_index=False)['valor'].max()
+            .rename(columns={'valor': 'tmax'})
+            .dropna(subset=['tmax'])
+        )
+    else:
+        df_temp = pd.DataFrame(columns=['codigo', 'tmax'])
+    
+    logger.info(f"Got temperature data for {len(df_temp)} stations")
+    
+    if df_temp.empty:
         logger.error("No temperature data available")
         return None
     
-    # Create DataFrame
-    df_temp = pd.DataFrame(temp_data)
-    
     # Create map
     return plot_temperature_map(
         stations_df=region_stations,
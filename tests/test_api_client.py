@@ -1,8 +1,9 @@
 """
 Tests for API client functionality.
 """
-from unittest.mock import Mock, patch
-from iniamet.api_client import APIClient
+from unittest.mock import AsyncMock, Mock, patch
+import pytest
+from iniamet.api_client import APIClient, TokenBucket
 
 
 class TestAPIClient:
@@ -110,3 +111,103 @@ class TestAPIEndpoints:
         
         assert isinstance(result, list)
         mock_request.assert_called_once()
+
+
+class TestTokenBucket:
+    """Test cases for the adaptive rate limiter."""
+    
+    def test_penalize_halves_rate_and_reward_ramps_back(self):
+        """Test that 429 penalties halve the rate and successes restore it."""
+        bucket = TokenBucket(rate=4.0)
+        bucket.penalize()
+        assert bucket.rate == 2.0
+        
+        for _ in range(20):
+            bucket.reward()
+        assert bucket.rate == 4.0
+    
+    def test_reward_probes_above_starting_rate(self):
+        """Test that successes ramp the rate past its start, up to max_rate."""
+        bucket = TokenBucket(rate=2.0, max_rate=4.0)
+        for _ in range(50):
+            bucket.reward()
+        assert bucket.rate == 4.0
+    
+    @patch('iniamet.api_client.requests.Session.get')
+    def test_only_paced_requests_wait(self, mock_get):
+        """Test that single requests skip the limiter and paced blocks use it."""
+        import time
+        mock_response = Mock()
+        mock_response.json.return_value = {"data": "test"}
+        mock_get.return_value = mock_response
+        
+        client = APIClient(rate_limit=5.0)
+        start = time.monotonic()
+        for _ in range(5):
+            client._request("estaciones")
+        assert time.monotonic() - start < 0.1
+        
+        start = time.monotonic()
+        with client.paced():
+            for _ in range(8):
+                client._request("estaciones")
+        assert time.monotonic() - start >= 0.3
+    
+    def test_acquire_honors_retry_after(self):
+        """Test that acquire waits for the Retry-After delay."""
+        import time
+        bucket = TokenBucket(rate=100.0)
+        bucket.penalize(retry_after=0.2)
+        
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.15
+    
+    def test_async_request_penalizes_429(self):
+        """Test that the async path honors Retry-After and retries through the limiter."""
+        aiohttp = pytest.importorskip('aiohttp')
+        import asyncio
+        from unittest.mock import MagicMock
+        
+        def response(status):
+            resp = MagicMock()
+            if status == 429:
+                resp.raise_for_status.side_effect = aiohttp.ClientResponseError(
+                    Mock(), (), status=429, headers={'Retry-After': '0.2'}
+                )
+            resp.read = AsyncMock(return_value=b'{"response": []}')
+            ctx = MagicMock()
+            ctx.__aenter__ = AsyncMock(return_value=resp)
+            ctx.__aexit__ = AsyncMock(return_value=False)
+            return ctx
+        
+        session = Mock()
+        session.get.side_effect = [response(429), response(200)]
+        client = APIClient(rate_limit=4.0)
+        
+        import time
+        start = time.monotonic()
+        result = asyncio.run(client._request_async(session, "estaciones"))
+        
+        assert result == []
+        assert session.get.call_count == 2
+        assert client.rate_limiter.rate == pytest.approx(2.4)
+        assert time.monotonic() - start >= 0.15
+    
+    def test_overlapping_paced_blocks_restore_configured_rate(self):
+        """Test that paced blocks exiting out of order leave the configured rate."""
+        client = APIClient(api_key='test', rate_limit=2.0, max_rate_limit=10.0)
+        block_a = client.paced(rate=8.0)
+        block_b = client.paced(rate=4.0)
+        
+        block_a.__enter__()
+        block_b.__enter__()
+        assert client.rate_limiter.base_rate == 4.0
+        
+        block_a.__exit__(None, None, None)
+        assert client.rate_limiter.base_rate == 4.0
+        
+        block_b.__exit__(None, None, None)
+        assert client.rate_limiter.base_rate == 2.0
+        assert client.rate_limiter.max_rate == 10.0
+        assert not client._should_pace()
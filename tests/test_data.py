@@ -1,9 +1,13 @@
 """
 Tests for data downloader functionality.
 """
+import asyncio
 from unittest.mock import Mock, patch
+import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from iniamet.api_client import APIClient
 from iniamet.data import DataDownloader
 
 
@@ -17,14 +21,11 @@ class TestDataDownloader:
             assert downloader is not None
     
     @patch('iniamet.data.APIClient')
-    def test_download_data_basic(self, mock_api):
+    def test_download_data_basic(self, mock_api, sample_records):
         """Test basic data download."""
         # Setup mock
         mock_client = Mock()
-        mock_client.get_data.return_value = [
-            {'tiempo': '2024-09-01 00:00:00', 'valor': 15.5},
-            {'tiempo': '2024-09-01 01:00:00', 'valor': 16.0}
-        ]
+        mock_client.get_data.return_value = sample_records
         mock_api.return_value = mock_client
         
         downloader = DataDownloader(api=mock_client)
@@ -38,6 +39,30 @@ class TestDataDownloader:
         assert isinstance(result, pd.DataFrame)
         assert len(result) >= 0
     
+    def test_bulk_download_delay_restores_rate(self, sample_records):
+        """Test that bulk_download(delay=...) only caps the rate while it runs."""
+        api = APIClient(api_key='test', rate_limit=2.0, max_rate_limit=10.0)
+        downloader = DataDownloader(api=api)
+        rates = []
+        
+        def fake_get_data(*args, **kwargs):
+            rates.append(api.rate_limiter.max_rate)
+            return sample_records
+        
+        with patch.object(api, 'get_data', side_effect=fake_get_data):
+            results = downloader.bulk_download(
+                stations=['INIA-47'],
+                variables=[2002],
+                start_date='2024-09-01',
+                end_date='2024-09-02',
+                delay=0.5
+            )
+        
+        assert list(results) == ['INIA-47_2002']
+        assert rates == [2.0]
+        assert api.rate_limiter.base_rate == 2.0
+        assert api.rate_limiter.max_rate == 10.0
+    
     @patch('iniamet.data.APIClient')
     def test_download_data_with_caching(self, mock_api):
         """Test data download with caching."""
@@ -66,19 +91,79 @@ class TestDataDownloader:
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
+    
+    def test_empty_response_is_not_refetched(self):
+        """Test that known-empty requests skip the API until use_cache=False."""
+        mock_client = Mock()
+        mock_client.get_data.return_value = []
+        
+        downloader = DataDownloader(api=mock_client)
+        for _ in range(2):
+            downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        assert mock_client.get_data.call_count == 1
+        
+        downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02", use_cache=False)
+        assert mock_client.get_data.call_count == 2
+    
+    def test_repeated_request_is_memoized(self):
+        """Test that identical requests reuse the processed DataFrame."""
+        mock_client = Mock()
+        mock_client.get_data.return_value = [{'tiempo': '2024-09-01 00:00:00', 'valor': 15.5}]
+        
+        downloader = DataDownloader(api=mock_client)
+        first = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        first['valor'] = 0.0
+        second = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        
+        assert mock_client.get_data.call_count == 1
+        assert second['valor'].tolist() == [15.5]
+        
+        downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02", use_cache=False)
+        assert mock_client.get_data.call_count == 2
+    
+    @patch('iniamet.data._copy_on_write_enabled', return_value=False)
+    def test_memo_copies_values_without_cow(self, _):
+        """Test that memoized results do not share data when copy-on-write is off."""
+        mock_client = Mock()
+        mock_client.get_data.return_value = [{'tiempo': '2024-09-01 00:00:00', 'valor': 15.5}]
+        
+        downloader = DataDownloader(api=mock_client)
+        first = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        second = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        
+        assert mock_client.get_data.call_count == 1
+        assert not np.shares_memory(first['valor'].to_numpy(), second['valor'].to_numpy())
+
+
+class TestChunkedDownload:
+    """Test downloads split into date windows."""
+    
+    def test_chunks_cover_range_without_duplicates(self):
+        """Test that windows share boundary days without duplicating rows."""
+        def fake_get_data(station, variable, start_date, end_date):
+            days = pd.date_range(start_date, end_date, freq='D')
+            return [{'tiempo': str(day), 'valor': float(day.day)} for day in days]
+        
+        mock_client = Mock()
+        mock_client.get_data.side_effect = fake_get_data
+        downloader = DataDownloader(api=mock_client)
+        
+        chunks = list(downloader.get_data_iter("INIA-47", 2002, "2024-09-01", "2024-09-10", chunk_days=4))
+        assert mock_client.get_data.call_count == 3
+        assert [len(chunk) for chunk in chunks] == [5, 4, 1]
+        
+        result = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-10", chunk_days=4)
+        assert result['tiempo'].tolist() == list(pd.date_range('2024-09-01', '2024-09-10', freq='D'))
 
 
 class TestDataProcessing:
     """Test data processing functions."""
     
     @patch('iniamet.data.APIClient')
-    def test_dataframe_conversion(self, mock_api):
+    def test_dataframe_conversion(self, mock_api, sample_records):
         """Test conversion of API data to DataFrame."""
         mock_client = Mock()
-        mock_client.get_data.return_value = [
-            {'tiempo': '2024-09-01 00:00:00', 'valor': 15.5},
-            {'tiempo': '2024-09-01 01:00:00', 'valor': 16.0}
-        ]
+        mock_client.get_data.return_value = sample_records
         mock_api.return_value = mock_client
         
         downloader = DataDownloader(api=mock_client)
@@ -92,3 +177,89 @@ class TestDataProcessing:
         if len(result) > 0:
             assert 'tiempo' in result.columns or result.index.name == 'tiempo'
             assert 'valor' in result.columns
+    
+    def test_float32_values(self):
+        """Test that value_dtype controls the 'valor' dtype."""
+        mock_client = Mock()
+        mock_client.get_data.return_value = [
+            {'tiempo': '2024-09-01 00:00:00', 'valor': 15.5},
+            {'tiempo': '2024-09-01 01:00:00', 'valor': None}
+        ]
+        
+        downloader = DataDownloader(api=mock_client, value_dtype='float32')
+        result = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        
+        assert result['valor'].dtype == 'float32'
+        assert result['valor'].iloc[0] == 15.5
+        assert result['valor'].isna().iloc[1]
+    
+    def test_iso_timestamps_are_parsed(self):
+        """Test that timestamps outside the usual API format still parse."""
+        mock_client = Mock()
+        mock_client.get_data.return_value = [
+            {'tiempo': '2024-09-01 00:00:00', 'valor': 15.5},
+            {'tiempo': '2024-09-01T01:00:00', 'valor': 16.0}
+        ]
+        
+        downloader = DataDownloader(api=mock_client)
+        result = downloader.get_data("INIA-47", 2002, "2024-09-01", "2024-09-02")
+        
+        assert result['tiempo'].tolist() == list(pd.date_range('2024-09-01', periods=2, freq='h'))
+
+
+class TestBulkAggregate:
+    """Test single-pass aggregation of bulk download results."""
+    
+    def test_bulk_aggregate_daily_mean(self):
+        """Test that all keys are aggregated in one long-format frame."""
+        downloader = DataDownloader(api=Mock())
+        results = {
+            'INIA-47_2002': pd.DataFrame({
+                'tiempo': pd.to_datetime(['2024-09-01 00:00', '2024-09-01 12:00', '2024-09-02 00:00']),
+                'valor': [10.0, 20.0, 5.0]
+            }),
+            'INIA-139_2002': pd.DataFrame({
+                'tiempo': pd.to_datetime(['2024-09-01 06:00']),
+                'valor': [12.0]
+            })
+        }
+        
+        result = downloader.bulk_aggregate(results, rule='D', agg_func='mean')
+        
+        assert list(result.columns) == ['variable', 'tiempo', 'valor']
+        assert len(result) == 3
+        first = result[result['variable'] == 'INIA-47_2002']
+        assert first['valor'].tolist() == [15.0, 5.0]
+    
+    def test_bulk_aggregate_rejects_unknown_function(self):
+        """Test that unknown aggregation functions raise ValueError."""
+        downloader = DataDownloader(api=Mock())
+        with pytest.raises(ValueError):
+            downloader.bulk_aggregate({}, agg_func='median')
+
+
+class TestAsyncDownload:
+    """Test asyncio-based bulk downloads."""
+    
+    def test_bulk_download_async(self):
+        """Test that async bulk download collects every station/variable pair."""
+        pytest.importorskip('aiohttp')
+        from unittest.mock import AsyncMock
+        
+        mock_client = Mock()
+        mock_client.create_async_session.side_effect = lambda: APIClient(api_key='test').create_async_session()
+        mock_client.get_data_async = AsyncMock(side_effect=[
+            [{'tiempo': '2024-09-01 00:00:00', 'valor': 15.5}],
+            [],
+        ])
+        
+        downloader = DataDownloader(api=mock_client)
+        results = asyncio.run(downloader.bulk_download_async(
+            stations=['INIA-47', 'INIA-139'],
+            variables=[2002],
+            start_date='2024-09-01',
+            end_date='2024-09-02'
+        ))
+        
+        assert list(results) == ['INIA-47_2002']
+        assert mock_client.get_data_async.await_count == 2
@@ -3,8 +3,9 @@ Tests for quality control functionality.
 """
 import pandas as pd
 import numpy as np
+import pytest
 from datetime import datetime
-from iniamet.qc import QualityControl, apply_quality_control
+from iniamet.qc import QualityControl, apply_quality_control, unpack_qc_flags, QC_EXTREME
 
 
 class TestQualityControl:
@@ -44,14 +45,22 @@ class TestQualityControl:
         # Should detect stuck sensor
         assert 'qc_stuck' in result.columns
     
-    def test_valid_data_passes_qc(self):
-        """Test that valid data passes quality control."""
-        # Create realistic temperature data
+    def test_stuck_sensor_flags_only_long_runs(self):
+        """Test that only runs of at least min_repeats values are flagged."""
         data = pd.DataFrame({
-            'tiempo': pd.date_range('2024-01-01', periods=24, freq='h'),
-            'valor': [15.0 + i * 0.5 for i in range(24)]  # Gradual change
+            'valor': [1.0, 2.0, 2.0, 3.0, 5.0, 5.0, 5.0, 5.0, np.nan, 5.0]
         })
         
+        qc = QualityControl()
+        result = qc.detect_stuck_sensor(data, min_repeats=4)
+        
+        expected = [False, False, False, False, False, True, True, True, False, False]
+        assert result['qc_stuck'].tolist() == expected
+    
+    def test_valid_data_passes_qc(self, hourly_temperature_df):
+        """Test that valid data passes quality control."""
+        data = hourly_temperature_df
+        
         clean_data = apply_quality_control(data, 'temperatura')
         
         # All data should pass
@@ -59,17 +68,54 @@ class TestQualityControl:
         assert len(clean_data) <= len(data)
 
 
-class TestQCHelperFunctions:
-    """Test QC helper functions."""
+class TestPackedQCFlags:
+    """Test the packed qc_bits representation."""
     
-    def test_apply_quality_control_with_temperature(self):
-        """Test apply_quality_control with temperature data."""
+    def test_packed_flags_match_bool_columns(self):
+        """Test that unpacking qc_bits reproduces the default bool columns."""
         data = pd.DataFrame({
-            'tiempo': pd.date_range('2024-01-01', periods=10, freq='h'),
-            'valor': np.random.uniform(10, 25, 10)  # Valid temperature range
+            'tiempo': pd.date_range('2024-01-01', periods=12, freq='h'),
+            'valor': [15.0, 20.0, 45.0, 18.0, 0.0, 0.0, 99.0, 17.0, 17.0, 17.0, 17.0, 16.0]
         })
         
-        result = apply_quality_control(data, 'temperatura')
+        qc = QualityControl()
+        expected = qc.apply_all_checks(data, 'temperatura')
+        packed = qc.apply_all_checks(data, 'temperatura', packed=True)
+        
+        assert packed['qc_bits'].dtype == np.uint8
+        assert 'qc_passed' not in packed.columns
+        assert packed['qc_bits'].iloc[2] & QC_EXTREME
+        pd.testing.assert_frame_equal(
+            unpack_qc_flags(packed).drop(columns='qc_bits'), expected
+        )
+        assert qc.get_qc_summary(packed) == qc.get_qc_summary(expected)
+
+
+class TestArrowQCFlags:
+    """Test Arrow-backed flag columns."""
+    
+    def test_arrow_flags_filter_and_summarize(self):
+        """Test that bool[pyarrow] flags behave like NumPy bools."""
+        pytest.importorskip('pyarrow')
+        data = pd.DataFrame({
+            'tiempo': pd.date_range('2024-01-01', periods=5, freq='h'),
+            'valor': [15.0, 20.0, 100.0, 18.0, 17.0]
+        })
+        
+        expected = QualityControl().apply_all_checks(data)
+        result = QualityControl(flag_dtype='bool[pyarrow]').apply_all_checks(data)
+        
+        assert str(result['qc_passed'].dtype) == 'bool[pyarrow]'
+        assert len(result[result['qc_passed']]) == len(expected[expected['qc_passed']])
+        assert QualityControl().get_qc_summary(result) == QualityControl().get_qc_summary(expected)
+
+
+class TestQCHelperFunctions:
+    """Test QC helper functions."""
+    
+    def test_apply_quality_control_with_temperature(self, hourly_temperature_df):
+        """Test apply_quality_control with temperature data."""
+        result = apply_quality_control(hourly_temperature_df, 'temperatura')
         assert isinstance(result, pd.DataFrame)
         assert 'valor' in result.columns
     
@@ -86,6 +132,20 @@ class TestQCHelperFunctions:
         assert len(result) < len(data)
         assert 999.0 not in result['valor'].values
         assert -999.0 not in result['valor'].values
+    
+    def test_apply_quality_control_hampel_is_opt_in(self):
+        """Test that Hampel outliers are only rejected when a window is given."""
+        data = pd.DataFrame({
+            'tiempo': pd.date_range('2024-01-01', periods=10, freq='h'),
+            'valor': [15.0, 15.2, 15.1, 15.3, 24.0, 15.2, 15.1, 15.3, 15.0, 15.2]
+        })
+        
+        default = apply_quality_control(data, 'temperatura')
+        result = apply_quality_control(data, 'temperatura', return_clean_only=False, hampel_window=5)
+        
+        assert len(default) == len(data)
+        assert result.index[result['qc_hampel']].tolist() == [4]
+        assert not result['qc_passed'].iloc[4]
 
 
 class TestQCEdgeCases:
@@ -97,6 +157,18 @@ class TestQCEdgeCases:
         result = apply_quality_control(data, 'temperatura')
         assert len(result) == 0
     
+    def test_empty_dataframe_keeps_flag_columns(self):
+        """Test that empty input still gets the QC output columns."""
+        data = pd.DataFrame(columns=['tiempo', 'valor'])
+        qc = QualityControl()
+        
+        result = qc.apply_all_checks(data, 'temperatura')
+        packed = qc.apply_all_checks(data, 'temperatura', packed=True)
+        
+        assert result['qc_passed'].dtype == bool
+        assert 'qc_stuck' in result.columns
+        assert packed['qc_bits'].dtype == np.uint8
+    
     def test_single_value(self):
         """Test QC with single value."""
         data = pd.DataFrame({
@@ -0,0 +1,109 @@
+"""
+Tests for regional downloader functionality.
+"""
+from unittest.mock import Mock
+import pandas as pd
+import pytest
+from iniamet.api_client import APIClient
+from iniamet.data import DataDownloader
+from iniamet.regional import RegionalDownloader
+from iniamet.utils import VAR_TEMPERATURA_MEDIA, VAR_PRECIPITACION
+
+
+def _make_downloader(station_codes, get_data):
+    """Build a RegionalDownloader backed by a mocked API."""
+    api = Mock()
+    api.get_data.side_effect = get_data
+    data_downloader = DataDownloader(api)
+    
+    client = Mock()
+    client.get_data_multi.side_effect = data_downloader.get_data_multi
+    client.get_stations.return_value = pd.DataFrame({
+        'codigo': station_codes,
+        'nombre': [f"Estación {code}" for code in station_codes],
+        'region': 'Ñuble',
+        'latitud': -36.6,
+        'longitud': -72.0,
+        'elevacion': 150.0,
+    })
+    return RegionalDownloader("R16", client=client), api
+
+
+class TestDownloadClimateData:
+    """Test consolidated regional downloads."""
+    
+    def test_stitches_variables_per_station(self):
+        """Test that each station gets one row per timestamp with all variable columns."""
+        def fake_get_data(station, variable, start_date, end_date):
+            if variable == str(VAR_TEMPERATURA_MEDIA):
+                return [{'tiempo': '2024-09-01 00:00:00', 'valor': 10.0},
+                        {'tiempo': '2024-09-01 01:00:00', 'valor': 11.0}]
+            return [{'tiempo': '2024-09-01 01:00:00', 'valor': 1.5}]
+        
+        downloader, api = _make_downloader(['INIA-47', 'INIA-139'], fake_get_data)
+        df = downloader.download_climate_data(
+            "2024-09-01", "2024-09-02",
+            variables=['temperature', 'precipitation'],
+            aggregation='raw',
+            max_workers=4
+        )
+        
+        assert api.get_data.call_count == 4
+        assert df['estacion_codigo'].tolist() == ['INIA-139'] * 2 + ['INIA-47'] * 2
+        assert list(df.columns[:3]) == ['tiempo', 'estacion_codigo', 'estacion_nombre']
+        assert df[f'valor_{VAR_TEMPERATURA_MEDIA}'].tolist() == [10.0, 11.0] * 2
+        assert df[f'valor_{VAR_PRECIPITACION}'].isna().tolist() == [True, False] * 2
+    
+    def test_failed_variable_is_skipped(self):
+        """Test that a failing request does not abort the other downloads."""
+        def fake_get_data(station, variable, start_date, end_date):
+            if variable == str(VAR_PRECIPITACION):
+                raise RuntimeError("API error")
+            return [{'tiempo': '2024-09-01 00:00:00', 'valor': 10.0}]
+        
+        downloader, _ = _make_downloader(['INIA-47'], fake_get_data)
+        df = downloader.download_climate_data("2024-09-01", "2024-09-02", aggregation='raw')
+        
+        assert len(df) == 1
+        assert df[f'valor_{VAR_TEMPERATURA_MEDIA}'].tolist() == [10.0]
+    
+    def test_workers_share_paced_limiter(self):
+        """Test that station workers keep the configured rate and skip nested pools."""
+        rates = []
+        
+        def fake_get_data(station, variable, start_date, end_date):
+            rates.append(downloader.client.api.rate_limiter.base_rate)
+            return [{'tiempo': '2024-09-01 00:00:00', 'valor': 10.0}]
+        
+        downloader, _ = _make_downloader(['INIA-47'], fake_get_data)
+        downloader.client.api = APIClient(api_key='test', rate_limit=2.0)
+        downloader.download_climate_data("2024-09-01", "2024-09-02", aggregation='raw', max_workers=6)
+        downloader.download_climate_data(
+            "2024-10-01", "2024-10-02", aggregation='raw', max_workers=6, rate_limit=4.0
+        )
+        
+        assert rates == [2.0, 2.0, 4.0, 4.0]
+        assert downloader.client.get_data_multi.call_args.kwargs['max_workers'] == 1
+        assert downloader.client.api.rate_limiter.base_rate == 2.0
+
+
+class TestSaveToCsv:
+    """Test saving consolidated downloads."""
+    
+    def test_save_parquet_round_trip(self, tmp_path):
+        """Test that Parquet output preserves the data."""
+        pytest.importorskip('pyarrow')
+        
+        downloader, _ = _make_downloader(['INIA-47'], lambda *args: [])
+        df = pd.DataFrame({
+            'tiempo': pd.date_range('2024-09-01', periods=3, freq='D'),
+            'estacion_codigo': 'INIA-47',
+            'region': 'Ñuble',
+            'valor': [10.0, 11.0, 12.0],
+        })
+        
+        path = downloader.save_to_csv(df, str(tmp_path / "clima.parquet"), format='parquet')
+        result = pd.read_parquet(path)
+        
+        assert result['valor'].tolist() == [10.0, 11.0, 12.0]
+        assert result['estacion_codigo'].astype(str).tolist() == ['INIA-47'] * 3
@@ -3,6 +3,8 @@ Tests for station management functionality.
 """
 from unittest.mock import Mock, patch
 import pandas as pd
+import pytest
+from iniamet.cache import CacheManager
 from iniamet.stations import StationManager
 
 
@@ -50,6 +52,21 @@ class TestStationManager:
         
         assert isinstance(stations, pd.DataFrame)
     
+    def test_filter_by_type_is_case_insensitive(self):
+        """Test that station types are stored upper-cased as categoricals."""
+        mock_client = Mock()
+        mock_client.get_stations.return_value = [
+            {'identificador': 'inia-47', 'region': 'Ñuble'},
+            {'identificador': 'DMC-1', 'region': 'Maule'}
+        ]
+        
+        manager = StationManager(api=mock_client)
+        stations = manager.get_stations(station_type='Inia')
+        
+        assert stations['codigo'].tolist() == ['inia-47']
+        assert isinstance(stations['tipo'].dtype, pd.CategoricalDtype)
+        assert isinstance(stations['region'].dtype, pd.CategoricalDtype)
+    
     @patch('iniamet.stations.APIClient')
     def test_get_station_by_code(self, mock_api):
         """Test getting single station by code."""
@@ -63,6 +80,39 @@ class TestStationManager:
         station = manager.get_stations('INIA-47')
         
         assert station is not None
+    
+    def test_get_station_returns_row(self):
+        """Test single-station lookup by code and its refresh on force_update."""
+        mock_client = Mock()
+        mock_client.get_stations.return_value = [
+            {'identificador': 'INIA-47', 'nombre': 'Chillán', 'region': 'Ñuble'},
+            {'identificador': 'INIA-139', 'nombre': 'Talca', 'region': 'Maule'}
+        ]
+        
+        manager = StationManager(api=mock_client)
+        
+        assert manager.get_station('INIA-139')['nombre'] == 'Talca'
+        assert manager.get_station('INIA-1') is None
+        
+        mock_client.get_stations.return_value = [
+            {'identificador': 'INIA-1', 'nombre': 'Nueva', 'region': 'Maule'}
+        ]
+        manager.get_stations(force_update=True)
+        assert manager.get_station('INIA-1')['nombre'] == 'Nueva'
+    
+    def test_get_variables_with_null_name(self):
+        """Test that variables with a null name are listed with an empty name."""
+        mock_client = Mock()
+        mock_client.get_variables.return_value = [
+            {'identificador': 2002, 'nombre': None, 'unidad': None},
+            {'identificador': 2001, 'nombre': 'Precipitación', 'unidad': 'mm'}
+        ]
+        
+        manager = StationManager(api=mock_client)
+        variables = manager.get_variables('INIA-47')
+        
+        assert variables['nombre'].tolist() == ['', 'Precipitación']
+        assert variables['nombre_norm'].tolist() == ['', 'precipitacion']
 
 
 class TestStationFiltering:
@@ -88,3 +138,47 @@ class TestStationFiltering:
         if len(stations) > 0:
             assert 'latitud' in stations.columns
             assert 'longitud' in stations.columns
+
+
+class TestClientStationMemo:
+    """Test station memoization on INIAClient."""
+    
+    def test_repeated_lookups_are_memoized(self):
+        """Test that repeated region lookups reuse the first result."""
+        from iniamet import INIAClient
+        
+        client = INIAClient(cache=False)
+        stations = pd.DataFrame({'codigo': ['INIA-47'], 'region': ['Ñuble']})
+        
+        with patch.object(client.station_manager, 'get_stations', return_value=stations) as mock_get:
+            first = client.get_stations(region="R16")
+            first['codigo'] = 'modified'
+            second = client.get_stations(region="R16")
+            assert mock_get.call_count == 1
+            assert second['codigo'].tolist() == ['INIA-47']
+            
+            client.get_stations(region="R16", force_update=True)
+            assert mock_get.call_count == 2
+
+
+class TestStationsCache:
+    """Test the on-disk stations cache."""
+    
+    def test_parquet_cache_keeps_categoricals(self, tmp_path):
+        """Test that a cache round trip preserves dtypes and supports column selection."""
+        pytest.importorskip('pyarrow')
+        
+        mock_client = Mock()
+        mock_client.get_stations.return_value = [
+            {'identificador': 'INIA-47', 'region': 'Ñuble', 'latitud': -36.6},
+            {'identificador': 'DMC-1', 'region': 'Maule', 'latitud': None}
+        ]
+        cache = CacheManager(cache_dir=str(tmp_path))
+        StationManager(api=mock_client, cache=cache).get_stations()
+        
+        cached = cache.get_stations()
+        subset = cache.get_stations(columns=['codigo', 'region'])
+        
+        assert cached['codigo'].tolist() == ['INIA-47', 'DMC-1']
+        assert isinstance(cached['region'].dtype, pd.CategoricalDtype)
+        assert list(subset.columns) == ['codigo', 'region']
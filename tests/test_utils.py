@@ -1,8 +1,12 @@
 """
 Tests for utility functions.
 """
+from datetime import date, datetime
 from iniamet.utils import (
     get_region_code,
+    normalize_text,
+    normalize_texts,
+    parse_date,
     REGION_MAP,
     VARIABLE_INFO
 )
@@ -76,3 +80,14 @@ class TestUtilityHelpers:
             assert len(code) == 3  # R01, R02, etc.
             assert isinstance(name, str)
             assert len(name) > 0
+    
+    def test_parse_date_accepts_all_input_types(self):
+        """Test parsing strings, dates and datetimes."""
+        assert parse_date("2024-09-01") == datetime(2024, 9, 1)
+        assert parse_date(date(2024, 9, 1)) == datetime(2024, 9, 1)
+        assert parse_date(datetime(2024, 9, 1, 12)) == datetime(2024, 9, 1, 12)
+    
+    def test_normalize_texts_matches_normalize_text(self):
+        """Test that batch normalization agrees with the scalar version."""
+        names = ["Precipitación", "ÑUBLE", "Radiación W/m²", "Çava", ""] * 300
+        assert normalize_texts(names) == [normalize_text(name) for name in names]